@@ -1,33 +1,46 @@
 import streamlit as st
-import os
-import tempfile
-import time
-from musictheory.arranger import generate_song
+from musictheory.arranger import song_bytes
 from musictheory.config import NOTE_NUMS, GENRES
 
+# Songs are generated in memory and cached per (root, genre, seed, options);
+# the cache is shared by every session and keeps at most this many results.
+SONG_CACHE_SIZE = 64
+
+
+@st.cache_data(max_entries=SONG_CACHE_SIZE, show_spinner=False)
+def cached_song(root, genre, seed, length, wav):
+    return song_bytes(NOTE_NUMS[root], genre.lower(), seed=seed, length=length, wav=wav)
+
+
 st.title("🎶 Simple Music Theory MIDI Generator")
 
 root = st.selectbox("Choose root note:", list(NOTE_NUMS.keys()))
 genre = st.selectbox("Choose genre:", list(GENRES.keys()))
+seed = int(st.number_input("Seed:", min_value=0, max_value=2**32 - 1, value=0, step=1))
+length = int(st.number_input("Length in bars (0 = genre structure):", min_value=0, value=0, step=4))
+wav = st.checkbox("Also render audio (WAV)")
 
 if st.button("Generate Song"):
     try:
-        # Create a temporary output file
-        timestamp = int(time.time())
-        out_file = f"{root}_{genre}_{timestamp}.mid"
-        temp_path = os.path.join(tempfile.gettempdir(), out_file)
-
-        # Generate MIDI
-        generate_song(NOTE_NUMS[root], genre.lower(), temp_path)
+        with st.spinner("Generating…"):
+            midi_data, wav_data = cached_song(root, genre, seed, length or None, wav)
 
-        st.success(f"Generated: {out_file}")
+        out_name = f"{root}_{genre}_{seed}"
+        st.success(f"Generated: {out_name}.mid")
 
-        with open(temp_path, "rb") as f:
+        st.download_button(
+            "⬇️ Download MIDI",
+            midi_data,
+            file_name=f"{out_name}.mid",
+            mime="audio/midi"
+        )
+        if wav_data is not None:
+            st.audio(wav_data, format="audio/wav")
             st.download_button(
-                "⬇️ Download MIDI",
-                f,
-                file_name=out_file,
-                mime="audio/midi"
+                "⬇️ Download WAV",
+                wav_data,
+                file_name=f"{out_name}.wav",
+                mime="audio/wav"
             )
 
     except Exception as e:
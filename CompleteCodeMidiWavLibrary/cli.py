@@ -1,8 +1,14 @@
 import argparse
 import os
-import random
-from musictheory.arranger import generate_song
-from musictheory.config import NOTE_NUMS, GENRES
+import sys
+from musictheory.snapshot import load_snapshot
+
+# Startup stays cheap: note/genre names come from the frozen theory snapshot,
+# and numpy/pretty_midi (via the arranger) are imported only once a command
+# actually generates something.
+THEORY = load_snapshot()
+NOTE_NUMS = THEORY["NOTE_NUMS"]
+GENRES = THEORY["GENRES"]
 
 
 # Mapping enharmonic equivalents (Db → C#, etc.)
@@ -21,6 +27,70 @@ def normalize_note(note: str) -> str:
     return ENHARMONIC_EQUIVS.get(note, note)
 
 
+def song_seed(base_seed, index):
+    """Per-song seed derived from the batch seed; independent of scheduling."""
+    import zlib
+    return zlib.crc32(f"{base_seed}|{index}".encode())
+
+
+def render_batch_song(job):
+    """Worker: pick root/genre from the song's own seed and write it."""
+    import random
+    from musictheory.arranger import generate_song
+
+    index, base_seed, prefix, length, stream, wav = job
+    seed = song_seed(base_seed, index)
+    rng = random.Random(seed)
+    root = rng.choice(list(NOTE_NUMS.keys()))
+    genre = rng.choice(list(GENRES.keys())).lower()
+    out_file = f"{prefix}_{index}.mid"
+    notes = generate_song(NOTE_NUMS[root], genre, out_file, seed=seed, length=length, stream=stream,
+                          wav=f"{prefix}_{index}.wav" if wav else None)
+    return index, root, genre, out_file, notes
+
+
+def run_batch(count, prefix, seed, jobs=1, length=None, stream=False, wav=False, writers=0):
+    """Generate songs 1..count across `jobs` processes.
+
+    Each song depends only on (seed, index), so the files are byte-identical
+    for any worker count. With one process, `writers` > 0 hands MIDI files to
+    that many background writer threads. Returns (songs, notes, seconds).
+    """
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    from musictheory.instrument import METRICS, measured, merge_results
+
+    todo = [(i, seed, prefix, length, stream, wav) for i in range(1, count + 1)]
+    t0 = time.perf_counter()
+    if jobs > 1 and count > 1:
+        render = measured(render_batch_song) if METRICS.enabled else render_batch_song
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        results = pool.map(render, todo, chunksize=max(1, count // (jobs * 8)))
+        if METRICS.enabled:
+            results = (merge_results([pair])[0] for pair in results)
+    else:
+        pool, results = None, map(render_batch_song, todo)
+    sink = None
+    if pool is None and writers > 0:
+        from musictheory.sink import ThreadedFileSink
+        from musictheory.utils import set_sink
+        sink = ThreadedFileSink(writers)
+        previous = set_sink(sink)
+    total_notes = 0
+    try:
+        for index, root, genre, out_file, notes in results:
+            total_notes += notes
+            print(f"🎲 [{index}/{count}] Root={root}, Genre={genre}, File={out_file}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if sink is not None:
+            set_sink(previous)
+            sink.close()
+            print(f"💾 Writer pool: {sink.report()}")
+    return count, total_notes, time.perf_counter() - t0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="🎶 Simple Music Theory MIDI Generator",
@@ -46,7 +116,16 @@ def main():
         "--random", action="store_true", help="Generate with a random root and genre"
     )
     parser.add_argument(
-        "--length", type=int, default=None, help="Optional song length (bars/measures)"
+        "--length", type=int, default=None,
+        help="Song length in bars; the genre's structure repeats to fill it"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Encode section by section into a single-track file (constant memory for long songs)"
+    )
+    parser.add_argument(
+        "--wav", nargs="?", const=True, default=None, metavar="FILE",
+        help="Also render audio with the built-in synthesizer (default: output name with .wav)"
     )
     parser.add_argument(
         "--batch", type=int, default=0, help="Generate N random songs in batch mode"
@@ -54,9 +133,41 @@ def main():
     parser.add_argument(
         "--prefix", default="song", help="Prefix for batch output files (default: song)"
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes (0 = all cores, default: 1): songs in parallel for --batch,\n"
+             "audio tracks in parallel for a single song with --wav"
+    )
+    parser.add_argument(
+        "--writers", type=int, default=0,
+        help="Background writer threads for single-process --batch MIDI output (default: 0, inline)"
+    )
+    parser.add_argument(
+        "--metrics", metavar="FILE",
+        help="Record stage timings and counters; write JSON (or Prometheus text for .prom)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Seed for reproducible output (batch: same seed → same files for any --jobs)"
+    )
 
     args = parser.parse_args()
+    if args.length is not None and args.length <= 0:
+        print(f"❌ Invalid length: {args.length} (must be a positive number of bars)")
+        return
+    if args.metrics:
+        from musictheory.instrument import METRICS
+        METRICS.enable()
+        try:
+            run(args)
+        finally:
+            METRICS.write(args.metrics)
+            print(f"📊 Metrics written to {args.metrics}")
+    else:
+        run(args)
 
+
+def run(args):
     # Handle list mode
     if args.list:
         print("🎵 Available root notes:")
@@ -67,23 +178,26 @@ def main():
 
     # Handle batch mode
     if args.batch > 0:
-        print(f"📦 Generating {args.batch} random songs with prefix '{args.prefix}'...")
-        for i in range(1, args.batch + 1):
-            root = random.choice(list(NOTE_NUMS.keys()))
-            genre = random.choice(list(GENRES.keys()))
-            out_file = f"{args.prefix}_{i}.mid"
-            print(f"🎲 [{i}/{args.batch}] Root={root}, Genre={genre}, File={out_file}")
-            if args.length:
-                generate_song(NOTE_NUMS[root], genre, out_file, length=args.length)
-            else:
-                generate_song(NOTE_NUMS[root], genre, out_file)
+        import random
+        seed = args.seed if args.seed is not None else random.randrange(2**32)
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        print(f"📦 Generating {args.batch} random songs with prefix '{args.prefix}' "
+              f"(seed={seed}, jobs={jobs})...")
+        songs, notes, seconds = run_batch(args.batch, args.prefix, seed, jobs,
+                                          args.length, args.stream, bool(args.wav), args.writers)
+        seconds = max(seconds, 1e-9)
         print("✅ Batch generation complete!")
+        print(f"⏱  {songs} songs, {notes} notes in {seconds:.2f}s → "
+              f"{songs / seconds:.1f} songs/sec, {notes / seconds:,.0f} notes/sec")
         return
 
     # Handle random mode
     if args.random:
+        import random
+        if args.seed is not None:
+            random.seed(args.seed)
         root = random.choice(list(NOTE_NUMS.keys()))
-        genre = random.choice(list(GENRES.keys()))
+        genre = random.choice(list(GENRES.keys())).lower()
         print(f"🎲 Randomly chosen: Root={root}, Genre={genre}")
     else:
         if not args.root or not args.genre:
@@ -97,7 +211,7 @@ def main():
         print(f"❌ Invalid root note: {args.root}")
         print(f"   Try one of: {', '.join(NOTE_NUMS.keys())}")
         return
-    if genre not in GENRES:
+    if genre not in (g.lower() for g in GENRES):
         print(f"❌ Invalid genre: {args.genre}")
         print(f"   Try one of: {', '.join(GENRES.keys())}")
         return
@@ -106,10 +220,12 @@ def main():
     print(f"🎶 Generating song → Root: {root}, Genre: {genre}, Output: {args.output}")
     root_midi = NOTE_NUMS[root]
 
-    if args.length:
-        generate_song(root_midi, genre, args.output, length=args.length)
-    else:
-        generate_song(root_midi, genre, args.output)
+    from musictheory.arranger import generate_song
+    wav = args.wav
+    if wav is True:
+        wav = os.path.splitext(args.output)[0] + ".wav"
+    generate_song(root_midi, genre, args.output, seed=args.seed, length=args.length,
+                  stream=args.stream, wav=wav, render_jobs=args.jobs)
 
     print(f"✅ Done! Saved to {os.path.abspath(args.output)}")
 
@@ -1,64 +1,164 @@
-import random, os
+import random, os, io, itertools
+import numpy as np
 from .config import *
-from .utils import create_named_midi
+from .instrument import count, timer
+from .utils import create_named_midi, encode_named_midi, ensure_dir, humanize_notes
+from .smf import SMFStreamWriter
+from .synth import SAMPLE_RATE, WavStreamWriter, render_wav, render_wav_parallel
 from .theory import roman_to_midi_progression
-
-def drum_track_for_genre(genre, bars, velocity=90):
-    groove = DRUM_GROOVES.get(genre, DRUM_GROOVES["pop"])
-    notes = []
-    for bar in range(bars):
-        for name, pos in groove:
-            pitch = DRUMS[name]
-            start = bar*4.0 + pos
-            notes.append((pitch, start, start+0.1, velocity))
-    return notes
-
-def bass_track_for_genre(chords_by_bar, genre, base_vel=88):
-    pattern = BASS_PATTERNS.get(genre, BASS_PATTERNS["pop"])
-    notes, time = [], 0.0
-    for chord in chords_by_bar:
-        root = min(chord) - 12
-        for interval in pattern:
-            pitch = root + interval
-            notes.append((pitch, time, time+1.0, base_vel))
-            time += 1.0
-    return notes
-
-def generate_melody(chords_by_bar, scale_intervals, root_midi):
-    melody, time = [], 0.0
+from .notes import make_notes, shift_notes_time
+
+def drum_track_for_genre(genre, bars, velocity=90, grooves=DRUM_GROOVES, drums=DRUMS):
+    """grooves/drums default to config's; libraries with their own kits pass theirs."""
+    groove = grooves.get(genre, grooves["pop"])
+    pitches = np.array([drums[name] for name, _ in groove])
+    positions = np.array([pos for _, pos in groove], dtype=np.float64)
+    starts = (np.arange(bars)[:, None]*4.0 + positions).ravel()
+    return make_notes(np.tile(pitches, bars), starts, starts+0.1, velocity)
+
+def bass_track_for_genre(chords_by_bar, genre, base_vel=88, patterns=BASS_PATTERNS):
+    pattern = patterns.get(genre, patterns["pop"])
+    roots = np.array([min(chord) for chord in chords_by_bar]) - 12
+    pitches = (roots[:, None] + np.array(pattern)).ravel()
+    starts = np.arange(len(pitches), dtype=np.float64)
+    return make_notes(pitches, starts, starts+1.0, base_vel)
+
+def generate_melody(chords_by_bar, scale_intervals, root_midi, rng=random):
+    pitches = []
     scale_notes = [root_midi+i for i in scale_intervals]
     for chord in chords_by_bar:
-        chord_tone = random.choice(chord[:3])
-        melody.append((chord_tone, time, time+0.5, 102)); time+=0.5
-        melody.append((random.choice(scale_notes), time, time+0.5, 96)); time+=0.5
-        for _ in range(2):
-            melody.append((random.choice(scale_notes), time, time+0.5, 94)); time+=0.5
-    return melody
-
-def generate_song(root_midi, genre, filename):
+        pitches.append(rng.choice(chord[:3]))
+        pitches.extend(rng.choice(scale_notes) for _ in range(3))
+    starts = np.arange(len(pitches))*0.5
+    velocities = np.tile([102, 96, 94, 94], len(chords_by_bar))
+    return make_notes(pitches, starts, starts+0.5, velocities)
+
+def iter_song_sections(root_midi, genre, length=None, rng=random):
+    """Yield (section, start_time, [(role, notes, is_drum), ...]) one section at a time.
+
+    Notes are already offset to the song timeline. With `length` (in bars, one
+    chord per bar) the genre structure repeats until that many bars have been
+    produced and the last section is cut short; without it the structure plays once.
+    rng (the random module or a random.Random) drives the melody.
+    """
     structure = SONG_STRUCTURES.get(genre, SONG_STRUCTURES["pop"])
-    midi_tracks, current_time = [], 0.0
     scale = SCALE_INTERVALS["major"]
+    sections = itertools.cycle(structure) if length else iter(structure)
+    current_time, bars_left = 0.0, length
 
-    for section in structure:
+    for section in sections:
+        if length and bars_left <= 0:
+            break
         roman_prog = SECTION_PROGS.get(section, SECTION_PROGS["verse"])
         chords = roman_to_midi_progression(roman_prog, root_midi)
-
-        piano = [(n, t+current_time, t+1+current_time, 90) for t,n in enumerate(chords[0])]
-        bass  = [(n, t+current_time, t+1+current_time, 80) for t,n in enumerate(chords[0])]
-        drums = drum_track_for_genre(genre, len(chords))
-        melody = generate_melody(chords, scale, root_midi)
-
-        midi_tracks.extend([
-            (f"{section}_piano", piano, False),
-            (f"{section}_bass", bass, False),
-            (f"{section}_drums", drums, True),
-            (f"{section}_melody", melody, False),
-        ])
+        if length:
+            chords = chords[:bars_left]
+            bars_left -= len(chords)
+
+        with timer("tracks"):
+            beats = np.arange(len(chords[0]), dtype=np.float64)
+            piano = make_notes(chords[0], beats, beats+1, 90)
+            bass  = make_notes(chords[0], beats, beats+1, 80)
+            drums = drum_track_for_genre(genre, len(chords))
+            melody = generate_melody(chords, scale, root_midi, rng)
+            tracks = [
+                ("piano", shift_notes_time(piano, current_time), False),
+                ("bass", shift_notes_time(bass, current_time), False),
+                ("drums", shift_notes_time(drums, current_time), True),
+                ("melody", shift_notes_time(melody, current_time), False),
+            ]
+        yield section, current_time, tracks
         current_time += len(chords)
 
-    create_named_midi(midi_tracks, filename)
+def song_tracks(root_midi, genre, seed=None, length=None):
+    """Unhumanized (f"{section}_{role}", notes, is_drum) tracks of a song."""
+    rng = random if seed is None else random.Random(seed)
+    return [(f"{section}_{role}", notes, is_drum)
+            for section, _, tracks in iter_song_sections(root_midi, genre, length, rng)
+            for role, notes, is_drum in tracks]
+
+def song_bytes(root_midi, genre, seed=None, length=None, wav=False, sample_rate=SAMPLE_RATE):
+    """Generate a song entirely in memory; returns (MIDI bytes, WAV bytes or None).
+
+    Same content as generate_song writes for the same arguments.
+    """
+    data, tracks = encode_named_midi(song_tracks(root_midi, genre, seed, length), genre=genre, seed=seed)
+    audio = None
+    if wav:
+        buf = io.BytesIO()
+        render_wav(tracks, buf, sample_rate)
+        audio = buf.getvalue()
+    return data, audio
+
+def generate_song(root_midi, genre, filename, seed=None, length=None, stream=False,
+                  wav=None, sample_rate=SAMPLE_RATE, render_jobs=1):
+    """Write a song as one track per section and role (format 1), or with
+    stream=True as a single merged track encoded section by section.
+
+    A seed fixes melody and humanization, so the same arguments always give the
+    same bytes. With `wav` the humanized tracks are also rendered to audio;
+    render_jobs > 1 (0 = all cores) renders tracks in parallel processes,
+    which only applies to non-streamed songs. Returns the number of notes
+    written; with filename=None nothing touches the disk and the result of
+    song_bytes() is returned instead.
+    """
+    if filename is None:
+        return song_bytes(root_midi, genre, seed, length, bool(wav), sample_rate)
+    if wav:
+        ensure_dir(os.path.dirname(wav))
+    if stream:
+        notes, seconds = stream_song(root_midi, genre, filename, seed=seed, length=length,
+                                     wav=wav, sample_rate=sample_rate)
+    else:
+        midi_tracks = create_named_midi(song_tracks(root_midi, genre, seed, length), filename,
+                                        genre=genre, seed=seed)
+        notes = sum(len(notes) for _, notes, _ in midi_tracks)
+        if wav and render_jobs != 1:
+            seconds = render_wav_parallel(midi_tracks, wav, sample_rate, jobs=render_jobs or None)
+        elif wav:
+            seconds = render_wav(midi_tracks, wav, sample_rate)
     print(f"🎼 Song created: {filename}")
+    if wav:
+        print(f"🔊 Audio rendered: {wav} ({seconds:.1f}s)")
+    return notes
+
+# Streamed songs merge every section of a role onto one channel
+STREAM_CHANNELS = {"piano": 0, "bass": 1, "melody": 2, "drums": 9}
+# Humanization only nudges notes by a few hundredths of a beat, so nothing a
+# later section adds can land more than this far before its start
+STREAM_MARGIN = 1.0
+
+def stream_song(root_midi, genre, filename, seed=None, length=None, wav=None,
+                sample_rate=SAMPLE_RATE):
+    """Encode a song to a type 0 MIDI file as its sections are generated.
+
+    Memory holds one section plus the notes still sounding from earlier ones,
+    and the first events reach the file right after the first section, so the
+    cost per bar does not grow with `length`. With `wav` the same notes are
+    rendered to audio block by block alongside. Returns (notes, audio seconds).
+    """
+    ensure_dir(os.path.dirname(filename))
+    rng = np.random.default_rng(seed)
+    melody_rng = random if seed is None else random.Random(seed)
+    programs = {channel: 0 for channel in STREAM_CHANNELS.values()}
+    audio = WavStreamWriter(wav, sample_rate) if wav else None
+    with open(filename, "wb") as f:
+        writer = SMFStreamWriter(f, programs)
+        for _, start, tracks in iter_song_sections(root_midi, genre, length, melody_rng):
+            writer.flush(writer.tick(start - STREAM_MARGIN))
+            if audio:
+                audio.render_time(start - STREAM_MARGIN)
+            for role, notes, is_drum in tracks:
+                notes = humanize_notes(notes, genre=genre, rng=rng)
+                with timer("midi_encode"):
+                    writer.add(notes, STREAM_CHANNELS[role])
+                if audio:
+                    audio.add(notes, is_drum, role)
+        writer.close()
+        count("files_written")
+        count("bytes_written", f.tell())
+        count("notes_written", writer.notes)
+    return writer.notes, (audio.close() if audio else None)
 
 
 # arrangement.py
@@ -74,8 +174,7 @@ def generate_song(root_midi, genre, filename):
 # the specified output directory.
 
 import os
-from midiutil import MIDIFile
-from config import (GENRE_DEFAULTS, GENRES, PROGRESSIONS, ROMAN_TO_CHORD,
+from .config import (GENRE_DEFAULTS, GENRES, PROGRESSIONS, ROMAN_TO_CHORD,
                     CHORD_FORMULAS, SCALE_INTERVALS, DRUM_GROOVES,
                     BASS_PATTERNS, DRUMS, GENRE_TEMPOS, ROOTS, NOTE_NUMS,
                     SONG_STRUCTURES, SECTION_PROGS, GENRE_INSTRUMENTS)
@@ -98,6 +197,8 @@ def generate_midi_for_genres(output_dir='midi_arrangements'):
     Returns:
         list: List of generated MIDI file paths.
     """
+    from midiutil import MIDIFile  # optional dependency, only needed here
+
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
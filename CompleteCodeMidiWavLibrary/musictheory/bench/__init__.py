@@ -0,0 +1,74 @@
+# musictheory/bench
+# ============================
+# Offline benchmark suite: python -m musictheory.bench
+# ============================
+# Runs fixed-seed scenarios over the generation, encoding and rendering hot
+# paths and reports one headline metric per scenario as JSON. Two reports
+# (e.g. from two commits) can be compared; a scenario whose metric got worse
+# by more than the threshold counts as a regression.
+
+import json
+import platform
+import subprocess
+import time
+
+import numpy as np
+
+from .scenarios import REPO_ROOT, SCENARIOS
+
+DEFAULT_THRESHOLD = 0.10   # 10% slower than the baseline is a regression
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names=None, scale=1.0, backend="pretty_midi", progress=None):
+    """Run scenarios (default: all) and return a JSON-able report."""
+    names = list(names or SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+    results = {}
+    for name in names:
+        if progress:
+            progress(name)
+        results[name] = SCENARIOS[name](scale=scale, backend=backend)
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "scale": scale,
+            "backend": backend,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Per-scenario change against a baseline report.
+
+    Returns rows of (name, baseline, current, change, regressed) where change
+    is the relative improvement (+) or slowdown (-) of the headline metric.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("metric"):
+            continue
+        ratio = result["metric"] / base["metric"]
+        change = ratio - 1 if result.get("higher_is_better", True) else 1 / ratio - 1
+        rows.append((name, base["metric"], result["metric"], change, change < -threshold))
+    return rows
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
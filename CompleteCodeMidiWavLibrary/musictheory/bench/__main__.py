@@ -0,0 +1,53 @@
+import argparse
+import json
+import sys
+
+from . import DEFAULT_THRESHOLD, compare, load, run
+from .scenarios import SCENARIOS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m musictheory.bench",
+        description="Fixed-seed benchmarks for generation, MIDI encoding and WAV rendering.",
+    )
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"Scenarios to run (default: all): {', '.join(SCENARIOS)}")
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a previous JSON report")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown that counts as a regression (default: {DEFAULT_THRESHOLD:.2f})")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Workload multiplier for song/note scenarios (e.g. 0.1 for a quick run)")
+    parser.add_argument("--backend", choices=["pretty_midi", "smf"], default="pretty_midi",
+                        help="MIDI backend for the library scenarios (default: pretty_midi)")
+    args = parser.parse_args(argv)
+
+    report = run(args.scenarios, scale=args.scale, backend=args.backend,
+                 progress=lambda name: print(f"⏱  {name}…", file=sys.stderr))
+    for name, result in report["results"].items():
+        print(f"{name:<20}{result['metric']:>14,.1f} {result['unit']}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = load(args.compare)
+        if baseline.get("meta", {}).get("scale") != args.scale:
+            print("⚠️  baseline was recorded at a different --scale", file=sys.stderr)
+        rows = compare(report, baseline, args.threshold)
+        regressions = [row for row in rows if row[4]]
+        for name, base, current, change, regressed in rows:
+            flag = "❌ regression" if regressed else "✅"
+            print(f"{name:<20}{base:>14,.1f} → {current:>14,.1f}  {change:+7.1%}  {flag}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
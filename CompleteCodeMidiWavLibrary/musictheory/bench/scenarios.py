@@ -0,0 +1,156 @@
+# musictheory/bench/scenarios.py
+# ============================
+# Benchmark scenarios
+# ============================
+# Each scenario builds its inputs from a fixed seed, times only the work under
+# test and returns {"metric": value, "unit": ..., "higher_is_better": ...}
+# plus whatever counts help interpret it. `scale` shrinks the workload for
+# quick runs; results are only comparable at the same scale.
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+SEED = 1234
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the generators' emoji progress lines."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@contextlib.contextmanager
+def scratch_dir():
+    """Run inside a throwaway directory (library scripts write relative paths)."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+
+@contextlib.contextmanager
+def midi_backend(backend):
+    """Make `backend` the default MIDI encoder while a scenario runs."""
+    from .. import utils
+    previous = utils.MIDI_BACKEND
+    utils.set_midi_backend(backend)
+    try:
+        yield
+    finally:
+        utils.set_midi_backend(previous)
+
+
+def build_stage(stage, backend):
+    """Build one musiclibtotal stage through the library engine -> (files, seconds)."""
+    from .. import engine
+    from ..libraries import PROFILES
+
+    with midi_backend(backend), scratch_dir(), quiet():
+        [(_, _, count, _, seconds)] = engine.build([PROFILES["musiclibtotal"]], stages={stage})
+    return count, seconds
+
+
+def files_rate(count, seconds):
+    return {"metric": count / seconds, "unit": "files/s", "higher_is_better": True,
+            "files": count, "seconds": seconds}
+
+
+def chord_files(scale=1.0, backend="pretty_midi"):
+    """Full musiclibtotal chords stage (every chord, root and inversion)."""
+    return files_rate(*build_stage("chords", backend))
+
+
+def genre_progressions(scale=1.0, backend="pretty_midi"):
+    """Full musiclibtotal progressions stage."""
+    return files_rate(*build_stage("progressions", backend))
+
+
+def songs(scale=1.0, backend="pretty_midi"):
+    """generate_song for 1,000 seeded (root, genre) picks."""
+    from ..arranger import generate_song
+    from ..config import GENRES, NOTE_NUMS
+
+    count = max(1, int(1000 * scale))
+    rng = random.Random(SEED)
+    picks = [(NOTE_NUMS[rng.choice(list(NOTE_NUMS))], rng.choice(list(GENRES)).lower())
+             for _ in range(count)]
+    notes = 0
+    with midi_backend(backend), scratch_dir(), quiet():
+        start = time.perf_counter()
+        for i, (root, genre) in enumerate(picks):
+            notes += generate_song(root, genre, f"song_{i}.mid", seed=SEED + i)
+        seconds = time.perf_counter() - start
+    return {"metric": count / seconds, "unit": "songs/s", "higher_is_better": True,
+            "songs": count, "notes": notes, "notes_per_s": notes / seconds, "seconds": seconds}
+
+
+def random_notes(count, seed=SEED):
+    from ..notes import make_notes
+    rng = np.random.default_rng(seed)
+    start = np.sort(rng.uniform(0, count / 8, count))
+    return make_notes(rng.integers(36, 96, count), start, start + rng.uniform(0.1, 1.0, count),
+                      rng.integers(40, 120, count))
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def humanize(scale=1.0, backend=None):
+    """humanize_notes on 100k notes (best of 5)."""
+    from ..utils import humanize_notes
+
+    notes = random_notes(max(1, int(100_000 * scale)))
+    seconds = best_of(lambda: humanize_notes(notes, genre="jazz", seed=SEED), 5)
+    return {"metric": len(notes) / seconds, "unit": "notes/s", "higher_is_better": True,
+            "notes": len(notes), "seconds": seconds}
+
+
+def midi_encode(scale=1.0, backend=None):
+    """smf.encode_smf throughput on a 4-track, 100k-note song (best of 3)."""
+    from ..smf import encode_smf
+
+    per_track = max(1, int(25_000 * scale))
+    tracks = [(f"track_{t}", random_notes(per_track, SEED + t), t == 3) for t in range(4)]
+    size = len(encode_smf(tracks))
+    seconds = best_of(lambda: encode_smf(tracks), 3)
+    return {"metric": 4 * per_track / seconds, "unit": "notes/s", "higher_is_better": True,
+            "notes": 4 * per_track, "bytes": size, "mb_per_s": size / seconds / 2**20,
+            "seconds": seconds}
+
+
+def wav_render(scale=1.0, backend=None):
+    """Real-time factor of render_wav on a seeded 3-minute song (cold tone cache)."""
+    from .. import synth
+
+    synth.TONE_CACHE.clear()
+    audio, seconds = synth.benchmark(bars=max(1, int(180 * scale)), genre="pop", seed=SEED)
+    stats = synth.TONE_CACHE.stats()
+    return {"metric": audio / seconds, "unit": "x real time", "higher_is_better": True,
+            "audio_seconds": audio, "seconds": seconds, "tone_cache_hit_rate": stats["hit_rate"]}
+
+
+SCENARIOS = {
+    "chord_files": chord_files,
+    "genre_progressions": genre_progressions,
+    "songs": songs,
+    "humanize": humanize,
+    "midi_encode": midi_encode,
+    "wav_render": wav_render,
+}
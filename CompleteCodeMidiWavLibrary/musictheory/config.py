@@ -498,7 +498,7 @@ TEXTURE_LEVELS = {
         "dynamics": "f"
     },
     "wall_of_sound": {
-        "instruments": 10+,
+        "instruments": 10,       # 10+
         "register_spread": 5,   # huge (low bass to high strings/brass)
         "rhythmic_density": 1.0,
         "articulation": "marcato",
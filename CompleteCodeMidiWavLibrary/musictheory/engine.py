@@ -0,0 +1,495 @@
+# musictheory/engine.py
+# ============================
+# Library build engine: python -m musictheory.engine [library ...]
+# ============================
+# The generator scripts each carried their own theory tables, MIDI writer and
+# build loop, and ran the loop at import time. A library is now a
+# LibraryProfile (see musictheory.libraries): a base directory and a few
+# stages, each a list of work items plus a function turning one item into
+# [(path, track_data)]. The engine builds any set of profiles in one process
+# or through one worker pool, so the pitch tables, SMF encoder, file sink,
+# build manifest and dedup planner are set up once per build, not per script.
+#
+# Workers only render and encode; the parent writes every file through its
+# sink and records it in the library's manifest, so writer threads, packs and
+# checkpointed incremental builds behave the same for any job count. Each item
+# reseeds `random` (and the Generator it humanizes with) from its own key before
+# rendering, which keeps the output identical for any job count and any
+# selection of libraries.
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .instrument import METRICS, count, measured, merge_results, timer
+from .manifest import BuildManifest, format_estimate
+from .notes import note_array
+from .pack import PackWriter
+from .planner import LINK_MODES, JobPlanner
+from .sink import PackSink, make_sink
+from .smf import estimate_size
+from .transpose import SMFTemplate, rekey, rekey_path
+from . import utils
+from .utils import MIDI_BACKENDS, encode_tracks, set_midi_backend, set_sink, write_file
+
+
+class Stage:
+    """One kind of output in a library.
+
+    items()        -> work items (tuples of names) in build order
+    files(item)    -> [(path, track_data)], track_data as for smf.encode_smf;
+                      may draw from `random`, which is seeded per item
+    paths(item)    -> the same paths without building any notes (optional;
+                      lets the sink create the directory tree up front)
+    inputs(item)   -> everything that shapes the item's output, hashed into the
+                      build manifest; keep it to the item's own formulas and
+                      settings so editing one table entry only invalidates the
+                      items that read it (default: see stage_inputs)
+    seed(item)     -> seed for `random` (default: hash of stage name and item)
+    root           -> position of the root name in an item when the item's
+                      files for every root are transpositions of each other
+                      (lets --template render one key and transpose the rest)
+    content(item)  -> JSON-able value that fully determines the bytes of the
+                      item's single file; items with equal content are
+                      generated once and linked (see musictheory.planner)
+    """
+
+    def __init__(self, name, items, files, paths=None, inputs=None, seed=None, root=None, content=None):
+        if content is not None and (paths is None or root is not None):
+            raise ValueError(f"stage {name!r}: content dedup needs paths() and no template root")
+        self.name = name
+        self.items = items
+        self.files = files
+        self.paths = paths
+        self.inputs = inputs
+        self.seed = seed
+        self.root = root
+        self.content = content
+
+
+class LibraryProfile:
+    """A library: where it is built and the stages that fill it.
+
+    humanize(notes, rng) runs on every track before encoding, with a NumPy
+    Generator seeded per item, and humanize_params are hashed along with it.
+    folders are created even if no file lands in them. Bump version whenever
+    rendering code changes output.
+    """
+
+    def __init__(self, name, base_dir, stages, note_nums, version=1, humanize=None,
+                 humanize_params=None, folders=(), description=""):
+        self.name = name
+        self.base_dir = base_dir
+        self.stages = {stage.name: stage for stage in stages}
+        self.note_nums = note_nums
+        self.version = version
+        self.humanize = humanize
+        self.humanize_params = humanize_params
+        self.folders = folders
+        self.description = description
+
+
+def get_profile(name):
+    """Profiles are looked up by name so work units stay picklable."""
+    from .libraries import PROFILES
+    return PROFILES[name]
+
+
+# ============================
+# BUILD SETTINGS (per process)
+# ============================
+# The MIDI backend and the sink files are written through are utils'
+# (utils.set_midi_backend / utils.set_sink), shared with the cli and app.
+
+# Template mode: all roots of an item share one seed, so each group is
+# rendered once in its first key and the other keys are derived by transposing
+# the encoded file (musictheory.transpose). Only stages that declare a root.
+TEMPLATE_MODE = False
+
+
+def set_template_mode(on):
+    global TEMPLATE_MODE
+    TEMPLATE_MODE = on
+
+
+def configure_worker(backend, template):
+    set_midi_backend(backend)
+    set_template_mode(template)
+
+
+# ============================
+# RENDERING (runs in workers)
+# ============================
+def item_seed(key):
+    return zlib.crc32("|".join(str(k) for k in key).encode())
+
+
+def without_root(stage, item):
+    return item[:stage.root] + item[stage.root + 1:]
+
+
+def humanize_seed(stage, item):
+    """Seed for one work item; template mode leaves the root out of the key."""
+    if stage.seed is not None:
+        return stage.seed(item)
+    if TEMPLATE_MODE and stage.root is not None:
+        item = without_root(stage, item)
+    return item_seed((stage.name,) + tuple(item))
+
+
+def encode(profile, track_data, rng=None):
+    """Humanize (if the profile does, drawing from `rng`) and encode with the
+    current backend."""
+    if profile.humanize is not None:
+        track_data = [(track[0], profile.humanize(track[1], rng)) + tuple(track[2:]) for track in track_data]
+    return encode_tracks(track_data)
+
+
+def render_item(unit):
+    """(library, stage, item) -> [(path, MIDI bytes, notes)] for the item's files."""
+    name, stage_name, item = unit
+    profile = get_profile(name)
+    stage = profile.stages[stage_name]
+    seed = humanize_seed(stage, item)
+    random.seed(seed)
+    rng = np.random.default_rng(seed)   # shared by every track of the item
+    return [(path, encode(profile, track_data, rng), sum(len(track[1]) for track in track_data))
+            for path, track_data in stage.files(item)]
+
+
+def template_groups(stage, items):
+    """Split items into groups that differ only in their root (first-seen order)."""
+    groups = {}
+    for item in items:
+        groups.setdefault(without_root(stage, item), []).append(item)
+    return list(groups.values())
+
+
+def render_template_group(unit):
+    """Render the first item of a group in full and transpose its files for the rest.
+
+    Returns one file list per item, like render_item.
+    """
+    name, stage_name, group = unit
+    profile = get_profile(name)
+    stage = profile.stages[stage_name]
+    first = render_item((name, stage_name, group[0]))
+    ref_root = group[0][stage.root]
+    with timer("template_parse"):
+        templates = [(path, SMFTemplate(data), notes) for path, data, notes in first]
+    outputs = [first]
+    for item in group[1:]:
+        root = item[stage.root]
+        shift = profile.note_nums[root] - profile.note_nums[ref_root]
+        files = []
+        for path, template, notes in templates:
+            with timer("transpose"):
+                data = template.render(shift, lambda text: rekey(text, ref_root, root))
+            count("files_transposed")
+            files.append((rekey_path(path, ref_root, root), data, notes))
+        outputs.append(files)
+    return outputs
+
+
+# ============================
+# PLANNING & BUILDING (parent process)
+# ============================
+def item_key(stage, item):
+    return "/".join((stage.name,) + tuple(str(k) for k in item))
+
+
+def content_digest(content):
+    return hashlib.sha1(json.dumps(content, default=repr).encode()).hexdigest()
+
+
+def stage_inputs(stage, item):
+    """What an item's manifest digest covers: stage.inputs(item), else the
+    item's content(), else the notes it renders under its seed."""
+    if stage.inputs is not None:
+        return stage.inputs(item)
+    if stage.content is not None:
+        return item, stage.content(item)
+    random.seed(humanize_seed(stage, item))
+    return item, [(path, [(track[0], note_array(track[1]).tolist()) + tuple(track[2:])
+                          for track in track_data])
+                  for path, track_data in stage.files(item)]
+
+
+def plan_stage(profile, stage, manifest, planner):
+    """Decide what a stage has to render.
+
+    Returns (items, canonical, todo, digests): every item, the items left after
+    content dedup (the rest are queued in the planner as aliases), the
+    canonical items that are stale, and {item: (manifest key, digest)} for them.
+    """
+    items = stage.items()
+    canonical = items
+    if stage.content is not None:
+        canonical = [item for item in items
+                     if planner.claim(content_digest(stage.content(item)), stage.paths(item)[0])]
+    if not manifest.enabled:
+        return items, canonical, canonical, {}
+    digests = {}
+    for item in canonical:
+        digest = manifest.digest(stage_inputs(stage, item), humanize_seed(stage, item), profile.humanize_params)
+        key = item_key(stage, item)
+        if not manifest.up_to_date(key, digest):
+            digests[item] = (key, digest)
+    return items, canonical, [item for item in canonical if item in digests], digests
+
+
+def run_stage(profile, stage, manifest, planner, pool=None, jobs=1):
+    """Render every stale item of a stage.
+
+    Returns (library, stage, item_count, rendered_count, seconds).
+    """
+    with timer(f"stage_{profile.name}_{stage.name}"):
+        start = time.perf_counter()
+        items, _, todo, digests = plan_stage(profile, stage, manifest, planner)
+        if stage.paths is not None:   # make the stage's directory tree once, up front
+            utils.SINK.plan(path for item in todo for path in stage.paths(item))
+        grouped = TEMPLATE_MODE and stage.root is not None
+        if grouped:
+            render = render_template_group
+            work = [(profile.name, stage.name, group) for group in template_groups(stage, todo)]
+        else:
+            render = render_item
+            work = [(profile.name, stage.name, item) for item in todo]
+
+        if pool is not None and len(work) > 1:
+            chunksize = max(1, len(work) // (jobs * 4))
+            if METRICS.enabled:
+                outputs = (merge_results([pair])[0]
+                           for pair in pool.map(measured(render), work, chunksize=chunksize))
+            else:
+                outputs = pool.map(render, work, chunksize=chunksize)
+        else:
+            outputs = map(render, work)
+
+        def completions():
+            # (item, files) as results arrive, so the manifest can checkpoint them
+            for (_, _, unit), out in zip(work, outputs):
+                if grouped:   # one file list per item of the group
+                    yield from zip(unit, out)
+                else:
+                    yield unit, out
+
+        replace = stage.content is not None and not isinstance(utils.SINK, PackSink)
+        try:
+            for item, files in completions():
+                for path, data, notes in files:
+                    write_file(path, data, notes, replace)
+                if item in digests:
+                    manifest.record(*digests[item], [path for path, _, _ in files])
+        finally:
+            manifest.checkpoint()   # keep what finished, even if the stage failed
+        return profile.name, stage.name, len(items), len(todo), time.perf_counter() - start
+
+
+def build(profiles, jobs=1, incremental=False, link="hardlink", stages=None):
+    """Build every stage of the given profiles (or only those named in `stages`)
+    with one shared worker pool when jobs > 1.
+
+    Returns one run_stage row per stage built.
+    """
+    pack = utils.SINK if isinstance(utils.SINK, PackSink) else None
+    pool = None
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=configure_worker,
+                                   initargs=(utils.MIDI_BACKEND, TEMPLATE_MODE))
+    stats = []
+    try:
+        for profile in profiles:
+            print(f"📚 {profile.name} → {profile.base_dir}")
+            # a pack is always written whole, so it never builds incrementally
+            manifest = BuildManifest(profile.base_dir, profile.version,
+                                     enabled=incremental and pack is None, flush=utils.SINK.flush)
+            planner = JobPlanner(link, unit="files")
+            if pack is None:
+                for folder in profile.folders:
+                    os.makedirs(os.path.join(profile.base_dir, folder), exist_ok=True)
+            for stage in profile.stages.values():
+                if stages is None or stage.name in stages:
+                    stats.append(run_stage(profile, stage, manifest, planner, pool, jobs))
+            if planner.aliases:
+                utils.SINK.flush()   # aliases point at canonical files, so those must be written
+                planner.materialize(manifest, pack and pack.pack,
+                                    pack.base_dir if pack else profile.base_dir)
+                print("🧭 Planner:", planner.summary())
+            if stages is None:   # a partial build must not prune the other stages
+                manifest.prune_orphans()
+            utils.SINK.flush()   # every file is on disk before the manifest is saved
+            manifest.save()
+            if manifest.enabled:
+                print(f"♻️  Incremental build: {manifest.summary()}")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return stats
+
+
+def estimate(profile, incremental=False, link="hardlink"):
+    """Plan a library without writing.
+
+    Returns (rows for manifest.format_estimate, items resumed from a journal).
+    Files are rendered in memory to count notes but never encoded.
+    """
+    manifest = BuildManifest(profile.base_dir, profile.version, enabled=incremental)
+    planner = JobPlanner(link, unit="files")
+    rows = []
+    for stage in profile.stages.values():
+        _, canonical, todo, _ = plan_stage(profile, stage, manifest, planner)
+        stale = set(todo)
+        files = notes = size = remaining = 0
+        for item in canonical:
+            random.seed(humanize_seed(stage, item))
+            for _, track_data in stage.files(item):
+                files += 1
+                notes += sum(len(track[1]) for track in track_data)
+                size += estimate_size(track_data)
+                remaining += item in stale
+        rows.append((stage.name, files, notes, size, remaining))
+    if planner.aliases:
+        rows.append(("aliases", len(planner.aliases), 0, 0, len(planner.aliases)))
+    return rows, manifest.resumed
+
+
+def verify_templates(profile, stage):
+    """Rebuild every file of a stage in memory and compare it with the one on disk.
+
+    Returns (files checked, paths that differ).
+    """
+    checked, mismatched = 0, []
+    for item in stage.items():
+        for path, data, _ in render_item((profile.name, stage.name, item)):
+            with open(path, "rb") as f:
+                on_disk = f.read()
+            checked += 1
+            if data != on_disk:
+                mismatched.append(path)
+    return checked, mismatched
+
+
+def print_stage_summary(stats, jobs):
+    print(f"⏱  Stage summary (jobs={jobs}):")
+    for library, stage, items, rendered, seconds in stats:
+        print(f"   {library + '/' + stage:<32}{items:>6} items {rendered:>6} rendered {seconds:>9.2f}s")
+    print(f"   {'total':<32}{sum(s[2] for s in stats):>6} items "
+          f"{sum(s[3] for s in stats):>6} rendered {sum(s[4] for s in stats):>9.2f}s")
+
+
+# ============================
+# CLI
+# ============================
+def main(argv=None):
+    from .libraries import PROFILES
+
+    parser = argparse.ArgumentParser(description="Build MIDI practice libraries from their profiles.")
+    parser.add_argument("libraries", nargs="*", metavar="LIBRARY",
+                        help=f"Libraries to build (default: all): {', '.join(PROFILES)}")
+    parser.add_argument("--list", action="store_true", help="List the libraries and exit")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes shared by all libraries (0 = all cores, default: 1)")
+    parser.add_argument("--backend", choices=MIDI_BACKENDS, default=utils.MIDI_BACKEND,
+                        help="MIDI encoder (default: smf; pretty_midi writes the same bytes, slower)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only rebuild files whose inputs changed and delete orphans; progress "
+                             "is checkpointed, so rerunning resumes an interrupted build")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Plan the build and print file/note/byte estimates without writing "
+                             "(with --incremental: how much is left to build)")
+    parser.add_argument("--template", action="store_true",
+                        help="Render each transposable item in one key and transpose the encoded "
+                             "file for the other roots (roots share humanization)")
+    parser.add_argument("--verify-templates", action="store_true",
+                        help="After the build, re-render every transposable file from scratch and "
+                             "check it is byte-identical to the one written")
+    parser.add_argument("--writers", type=int, default=0,
+                        help="Background writer threads so encoding overlaps disk writes "
+                             "(default: 0, inline)")
+    parser.add_argument("--write-queue", type=int, default=256,
+                        help="Encoded files allowed to wait for a writer (default: 256)")
+    parser.add_argument("--links", choices=LINK_MODES, default="hardlink",
+                        help="How duplicate outputs (e.g. modes repeated under every scale) "
+                             "point at the single generated copy (default: hardlink)")
+    parser.add_argument("--pack", metavar="FILE",
+                        help="Write the libraries into one zip container instead of a tree "
+                             "(members are relative to the library when building just one)")
+    parser.add_argument("--deflate", action="store_true", help="Compress members of --pack")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Write stage timings/counters as JSON (Prometheus text for .prom)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.libraries if name not in PROFILES]
+    if unknown:
+        parser.error(f"unknown library {unknown[0]!r}; choose from {', '.join(PROFILES)}")
+    if args.list:
+        for profile in PROFILES.values():
+            print(f"{profile.name:<20}{profile.base_dir:<34}{profile.description}")
+        return 0
+    if args.pack and args.verify_templates:
+        parser.error("--verify-templates reads the written files back; it can't be used with --pack")
+    profiles = [PROFILES[name] for name in dict.fromkeys(args.libraries or PROFILES)]
+
+    if args.metrics:
+        METRICS.enable()
+    set_midi_backend(args.backend)
+    set_template_mode(args.template)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if args.dry_run:
+        for profile in profiles:
+            rows, resumed = estimate(profile, args.incremental, args.links)
+            print(f"📝 Dry run: {profile.base_dir}"
+                  + (f" ({resumed} items checkpointed by an interrupted build)" if resumed else ""))
+            print(format_estimate(rows))
+        return 0
+
+    if args.pack:
+        base_dir = profiles[0].base_dir if len(profiles) == 1 else "."
+        sink = PackSink(PackWriter(args.pack, compress=args.deflate), base_dir)
+    else:
+        sink = make_sink(args.writers, args.write_queue)
+    previous = set_sink(sink)
+    try:
+        stats = build(profiles, jobs, args.incremental, args.links)
+    finally:
+        set_sink(previous)
+        sink.close()
+
+    print_stage_summary(stats, jobs)
+    if sink.files:
+        print(f"💾 Writes: {sink.report()}")
+    if args.pack:
+        print(f"✅ {sink.pack.files} MIDI files packed into {args.pack}")
+    else:
+        print("✅ Built", ", ".join(profile.base_dir for profile in profiles))
+    if args.metrics:
+        METRICS.write(args.metrics)
+        print(f"📊 Metrics written to {args.metrics}")
+    if args.verify_templates:
+        mismatched = []
+        for profile in profiles:
+            for stage in profile.stages.values():
+                if stage.root is None:
+                    continue
+                checked, bad = verify_templates(profile, stage)
+                mismatched += bad
+                print(f"🔎 {profile.name}/{stage.name}: {checked - len(bad)}/{checked} "
+                      f"files identical to a full rebuild")
+        if mismatched:
+            print("❌ Mismatched files:", *mismatched[:10], sep="\n   ")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# musictheory/instrument.py
+# ============================
+# Opt-in stage timers and counters
+# ============================
+# Disabled by default: timer() hands back a shared no-op context manager and
+# count() returns at once, so instrumented hot paths cost one flag check.
+# Once enabled, per-stage seconds/calls and counters (files, notes, bytes)
+# accumulate in METRICS and can be written as a JSON report or a Prometheus
+# text file. Stages nest, so their times are inclusive (e.g. humanize is part
+# of a progression stage). Worker processes send a snapshot back with each
+# result via measured(), which the parent merges.
+
+import contextlib
+import json
+import time
+
+NULL_TIMER = contextlib.nullcontext()
+
+
+class Metrics:
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.stages = {}     # name -> [seconds, calls]
+        self.counters = {}
+        self.started = time.perf_counter()
+
+    def enable(self, on=True):
+        self.enabled = on
+        self.reset()
+
+    @contextlib.contextmanager
+    def _timed(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(stage, [0.0, 0])
+            entry[0] += time.perf_counter() - start
+            entry[1] += 1
+
+    def timer(self, stage):
+        """Context manager adding the enclosed wall time to `stage`."""
+        return self._timed(stage) if self.enabled else NULL_TIMER
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self):
+        return {"stages": {k: list(v) for k, v in self.stages.items()},
+                "counters": dict(self.counters)}
+
+    def merge(self, snapshot):
+        for name, (seconds, calls) in snapshot["stages"].items():
+            entry = self.stages.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += calls
+        for name, n in snapshot["counters"].items():
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self):
+        """Per-stage totals, counters and whole-run rates."""
+        wall = time.perf_counter() - self.started
+        c = self.counters
+        return {
+            "wall_seconds": wall,
+            "stages": {name: {"seconds": s, "calls": n} for name, (s, n) in sorted(self.stages.items())},
+            "counters": dict(sorted(c.items())),
+            "files_per_sec": c.get("files_written", 0) / wall if wall else 0.0,
+            "notes_per_sec": c.get("notes_written", 0) / wall if wall else 0.0,
+            "bytes_written": c.get("bytes_written", 0),
+        }
+
+    def to_json(self):
+        return json.dumps(self.report(), indent=2)
+
+    def to_prometheus(self, prefix="musictheory"):
+        r = self.report()
+        lines = [f"# TYPE {prefix}_stage_seconds_total counter"]
+        lines += [f'{prefix}_stage_seconds_total{{stage="{name}"}} {s["seconds"]:.6f}'
+                  for name, s in r["stages"].items()]
+        lines.append(f"# TYPE {prefix}_stage_calls_total counter")
+        lines += [f'{prefix}_stage_calls_total{{stage="{name}"}} {s["calls"]}'
+                  for name, s in r["stages"].items()]
+        for name, n in r["counters"].items():
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {n}"]
+        for name in ("wall_seconds", "files_per_sec", "notes_per_sec"):
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {r[name]:.6f}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write the report; .prom/.txt files get Prometheus text, anything else JSON."""
+        text = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json() + "\n"
+        with open(path, "w") as f:
+            f.write(text)
+
+
+METRICS = Metrics()
+timer = METRICS.timer
+count = METRICS.count
+
+
+class measured:
+    """Wrap a pool worker function so it returns (result, metrics snapshot)."""
+
+    def __init__(self, fn):
+        self.fn = fn
+
+    def __call__(self, *args):
+        if not METRICS.enabled:
+            METRICS.enable()
+        METRICS.reset()
+        return self.fn(*args), METRICS.snapshot()
+
+
+def merge_results(pairs):
+    """Merge worker snapshots from measured() and return the plain results."""
+    results = []
+    for result, snapshot in pairs:
+        METRICS.merge(snapshot)
+        results.append(result)
+    return results
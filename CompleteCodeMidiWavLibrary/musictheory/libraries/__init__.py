@@ -0,0 +1,20 @@
+# musictheory/libraries
+# ============================
+# Library profiles built by musictheory.engine
+# ============================
+# One module per library, named after the script that used to build it. A
+# profile only declares data and item -> files functions; theory dicts the
+# libraries share live in .common. The engine finds profiles here by name.
+
+from . import jazz, musicallib, musicallib2, musiclib, musiclibtotal, piano, simplemusictheory
+
+PROFILES = {profile.name: profile for profile in (
+    musiclib.PROFILE,
+    musicallib.PROFILE,
+    musicallib2.PROFILE,
+    simplemusictheory.PROFILE,
+    piano.FULL_PROFILE,
+    piano.RHYTHMIC_PROFILE,
+    jazz.PROFILE,
+    musiclibtotal.PROFILE,
+)}
@@ -0,0 +1,82 @@
+# musictheory/libraries/common.py
+# ============================
+# Theory data shared by the library profiles
+# ============================
+# Every generator script used to define these for itself. Profiles that read
+# equal chord/scale dicts also get the same tables.shared_tables instance, so
+# the pitch tables are built once per process however many libraries use them.
+
+ROOTS = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+NOTE_NUMS = {note: 60 + i for i, note in enumerate(ROOTS)}   # C4 = 60
+
+# Triads, sevenths and ninths
+BASIC_CHORDS = {
+    "major": [0, 4, 7],
+    "minor": [0, 3, 7],
+    "diminished": [0, 3, 6],
+    "augmented": [0, 4, 8],
+    "major7": [0, 4, 7, 11],
+    "minor7": [0, 3, 7, 10],
+    "dominant7": [0, 4, 7, 10],
+    "major9": [0, 4, 7, 11, 14],
+    "minor9": [0, 3, 7, 10, 14],
+    "dominant9": [0, 4, 7, 10, 14]
+}
+
+# Adds suspensions, sixths, diminished sevenths and 13ths
+EXTENDED_CHORDS = {
+    "major": [0, 4, 7],
+    "minor": [0, 3, 7],
+    "dominant7": [0, 4, 7, 10],
+    "minor7": [0, 3, 7, 10],
+    "major7": [0, 4, 7, 11],
+    "augmented": [0, 4, 8],
+    "diminished": [0, 3, 6],
+    "half_dim7": [0, 3, 6, 10],
+    "dim7": [0, 3, 6, 9],
+    "sus2": [0, 2, 7],
+    "sus4": [0, 5, 7],
+    "major6": [0, 4, 7, 9],
+    "minor6": [0, 3, 7, 9],
+    "9": [0, 4, 7, 10, 14],
+    "minor9": [0, 3, 7, 10, 14],
+    "maj9": [0, 4, 7, 11, 14],
+    "13": [0, 4, 7, 10, 14, 17, 21]
+}
+
+DIATONIC_MODES = {
+    "major": [0, 2, 4, 5, 7, 9, 11],
+    "minor": [0, 2, 3, 5, 7, 8, 10],
+    "dorian": [0, 2, 3, 5, 7, 9, 10],
+    "phrygian": [0, 1, 3, 5, 7, 8, 10],
+    "lydian": [0, 2, 4, 6, 7, 9, 11],
+    "mixolydian": [0, 2, 4, 5, 7, 9, 10],
+    "locrian": [0, 1, 3, 5, 6, 8, 10]
+}
+
+# All major/minor modes plus harmonic and melodic minor
+LIBRARY_SCALES = {
+    **DIATONIC_MODES,
+    "harmonic_minor": [0, 2, 3, 5, 7, 8, 11],
+    "melodic_minor": [0, 2, 3, 5, 7, 9, 11]
+}
+
+RHYTHM_PATTERNS = {
+    "straight": [1, 1, 1, 1],
+    "syncopated": [0.75, 0.25, 1, 1],
+    "triplet": [2/3, 2/3, 2/3],
+    "swing": [0.66, 0.34, 0.66, 0.34]
+}
+
+VELOCITIES = [60, 80, 100, 120]
+
+
+def sequence(pitches, durations=(1,), velocity=100):
+    """Notes played one after another, cycling through `durations` (in beats)."""
+    notes = []
+    time = 0.0
+    for i, pitch in enumerate(pitches):
+        duration = durations[i % len(durations)]
+        notes.append((pitch, time, time + duration, velocity))
+        time += duration
+    return notes
@@ -0,0 +1,103 @@
+# musictheory/libraries/jazz.py
+# ============================
+# Professional_Jazz_Piano_Library (jazz.py)
+# ============================
+# A file per root and jazz chord: random inversions with mixed rhythms and
+# dynamics in the right hand (lightly swung), a stepping bass in the left.
+
+import os
+import random
+
+from ..engine import LibraryProfile, Stage
+from ..tables import shared_tables
+from .common import NOTE_NUMS, ROOTS, VELOCITIES
+
+BASE_DIR = "Professional_Jazz_Piano_Library"
+FOLDERS = ["Scales", "Chords", "Arpeggios", "Progressions", "Melodies", "Counterpoint", "Walking_Bass"]
+
+# Extended chords and altered dominants
+JAZZ_CHORDS = {
+    "major": [0, 4, 7],
+    "minor": [0, 3, 7],
+    "dominant7": [0, 4, 7, 10],
+    "minor7": [0, 3, 7, 10],
+    "major7": [0, 4, 7, 11],
+    "dominant7b9": [0, 4, 7, 10, 13],
+    "dominant7#9": [0, 4, 7, 10, 15],
+    "half_dim7": [0, 3, 6, 10],
+    "dim7": [0, 3, 6, 9]
+}
+
+JAZZ_SCALES = {
+    "major": [0, 2, 4, 5, 7, 9, 11],
+    "minor": [0, 2, 3, 5, 7, 8, 10],
+    "dorian": [0, 2, 3, 5, 7, 9, 10],
+    "mixolydian": [0, 2, 4, 5, 7, 9, 10],
+    "lydian": [0, 2, 4, 6, 7, 9, 11]
+}
+
+TABLES = shared_tables(JAZZ_CHORDS, JAZZ_SCALES)
+
+RHYTHMS = [0.25, 0.5, 0.75, 1]   # sixteenth, eighth, dotted eighth, quarter
+BASS_STEPS = [0, 2, 4]
+BARS = 8
+SWING = 1.05
+
+
+def swing_timing(duration):
+    """Lengthen eighths and longer a little."""
+    return duration * SWING if duration >= 0.5 else duration
+
+
+def jazz_hands(left, right):
+    """(pitch, beats, velocity) lists -> track_data; the right hand starts where
+    the matching left-hand note ends, like piano.two_hands, and is swung."""
+    left_notes, right_notes = [], []
+    time = 0
+    for i in range(max(len(left), len(right))):
+        if i < len(left):
+            pitch, duration, velocity = left[i]
+            left_notes.append((pitch, time, time + duration, velocity))
+            time += duration
+        if i < len(right):
+            pitch, duration, velocity = right[i]
+            right_notes.append((pitch, time, time + swing_timing(duration), velocity))
+    return [(None, left_notes, False), (None, right_notes, False)]
+
+
+def chord_paths(item):
+    root, chord_name = item
+    return [os.path.join(BASE_DIR, "Chords", f"{root}_{chord_name}_jazz.mid")]
+
+
+def chord_inputs(item):
+    return item, JAZZ_CHORDS[item[1]], RHYTHMS, VELOCITIES, BASS_STEPS, BARS, SWING
+
+
+def chord_files(item):
+    root, chord_name = item
+    root_midi = NOTE_NUMS[root]
+    inversions = [sorted(TABLES.chord(root_midi, chord_name, i)) for i in range(len(JAZZ_CHORDS[chord_name]))]
+    total_notes = BARS * 4
+    right = []
+    while len(right) < total_notes:
+        inversion = random.choice(inversions)
+        duration = random.choice(RHYTHMS)
+        for pitch in inversion:
+            right.append((pitch, duration, random.choice(VELOCITIES)))
+    left = []
+    while len(left) < total_notes:
+        step = random.choice(BASS_STEPS)
+        duration = random.choice(RHYTHMS)
+        left.append((root_midi - 12 + step, duration, random.choice(VELOCITIES)))
+    return [(chord_paths(item)[0], jazz_hands(left, right))]
+
+
+PROFILE = LibraryProfile(
+    "jazz", BASE_DIR,
+    [Stage("chords", lambda: [(r, c) for r in ROOTS for c in JAZZ_CHORDS], chord_files, chord_paths,
+           chord_inputs)],
+    note_nums=NOTE_NUMS,
+    folders=FOLDERS,
+    description="Jazz voicings with dynamics, swing and a stepping bass",
+)
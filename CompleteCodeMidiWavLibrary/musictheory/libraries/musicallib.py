@@ -0,0 +1,210 @@
+# musictheory/libraries/musicallib.py
+# ============================
+# MIDILib_Library (musicallib.py)
+# ============================
+# Scales with their modes and arpeggios, every chord inversion, and each
+# progression rendered in every combination of rhythm and velocity pattern.
+# Scale, mode, arpeggio and chord files are keyed by their notes, so content
+# repeated across the tree (each mode under every parent scale, a scale and
+# the same mode) is generated once and linked.
+
+import functools
+import itertools
+import os
+import random
+import zlib
+
+import numpy as np
+
+from ..engine import LibraryProfile, Stage
+from ..tables import shared_tables
+from .common import EXTENDED_CHORDS, LIBRARY_SCALES, NOTE_NUMS, VELOCITIES, sequence
+
+BASE_DIR = "MIDILib_Library"
+TABLES = shared_tables(EXTENDED_CHORDS, LIBRARY_SCALES)
+
+PROGRESSIONS = {
+    "pop_I_V_vi_IV": ["I", "V", "vi", "IV"],
+    "blues_I_IV_V": ["I", "IV", "V"],
+    "jazz_ii_V_I": ["ii", "V", "I"]
+}
+ROMAN_TO_CHORD = {
+    "I": (0, "major"),
+    "ii": (2, "minor"),
+    "iii": (4, "minor"),
+    "IV": (5, "major"),
+    "V": (7, "major"),
+    "vi": (9, "minor"),
+    "vii°": (11, "diminished")
+}
+
+VELOCITY_PATTERNS = {
+    "soft": [60, 70, 65, 75],
+    "medium": [80, 90, 85, 95],
+    "loud": [100, 110, 105, 115],
+    "random": VELOCITIES
+}
+RHYTHM_PATTERNS = {
+    "straight": [1],
+    "swing": [0.66, 0.34],
+    "arpeggio": [0.5]
+}
+
+
+def midi_file(path, notes):
+    return [(path, [(None, sequence(notes), False)])]
+
+
+# ----------------------
+# Scales, modes, arpeggios, chords
+# ----------------------
+def scale_paths(item):
+    scale_name, root = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, f"{root}_{scale_name}.mid")]
+
+
+def scale_notes(item):
+    scale_name, root = item
+    return TABLES.scale(NOTE_NUMS[root], scale_name)
+
+
+def mode_paths(item):
+    scale_name, root, mode_name = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, "Modes", mode_name, f"{root}_{mode_name}.mid")]
+
+
+def mode_notes(item):
+    _, root, mode_name = item
+    return TABLES.scale(NOTE_NUMS[root], mode_name)
+
+
+def arpeggio_paths(item):
+    scale_name, root = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, "Arpeggios", f"{root}_{scale_name}_arp.mid")]
+
+
+def arpeggio_notes(item):
+    return scale_notes(item)[::2]
+
+
+def chord_paths(item):
+    chord_name, root, inversion = item
+    return [os.path.join(BASE_DIR, "Chords", chord_name, f"Inversion_{inversion}",
+                         f"{root}_{chord_name}_inv{inversion}.mid")]
+
+
+def chord_notes(item):
+    chord_name, root, inversion = item
+    return TABLES.chord(NOTE_NUMS[root], chord_name, inversion)
+
+
+def note_stage(name, items, paths, notes):
+    """Stage of one single-track file per item, keyed and deduplicated by its notes."""
+    return Stage(name, items, lambda item: midi_file(paths(item)[0], notes(item)), paths,
+                 lambda item: (item, notes(item)), content=lambda item: notes(item))
+
+
+def scale_items():
+    return [(s, r) for s in LIBRARY_SCALES for r in NOTE_NUMS]
+
+
+# ----------------------
+# Progressions (full sequences)
+# ----------------------
+# The chord skeleton (flat pitches plus each note's chord and position in it)
+# is built once per (progression, root). Every variant axis turns the skeleton
+# into note columns with array transforms, and a file is written for each
+# combination of axis values, so adding an axis adds files, not core work.
+@functools.lru_cache(maxsize=None)
+def chord_skeleton(prog_name, root):
+    chords = [TABLES.chord(NOTE_NUMS[root] + interval, chord_type)
+              for interval, chord_type in (ROMAN_TO_CHORD[roman] for roman in PROGRESSIONS[prog_name])]
+    sizes = [len(chord) for chord in chords]
+    return {
+        "pitch": np.array([note for chord in chords for note in chord]),
+        "chord": np.repeat(np.arange(len(chords)), sizes),
+        "index": np.concatenate([np.arange(n) for n in sizes]),
+        "sizes": np.array(sizes),
+    }
+
+
+def chord_starts(steps):
+    """Start time of each chord when chord k lasts steps[k] (summed left to right)."""
+    return np.concatenate(([0.0], np.cumsum(steps[:-1], dtype=float)))
+
+
+def rhythm_variant(sk, rhythm_name, rhythm_durations):
+    if rhythm_name == "arpeggio":
+        note_length = 0.5
+        starts = chord_starts(note_length * sk["sizes"])[sk["chord"]]
+        return {"start": starts + sk["index"] * note_length,
+                "end": starts + (sk["index"] + 1) * note_length}
+    duration = sum(rhythm_durations)
+    starts = chord_starts(np.full(len(sk["sizes"]), duration))[sk["chord"]]
+    return {"start": starts, "end": starts + duration}
+
+
+def velocity_variant(sk, vel_pattern, vel_values):
+    if vel_pattern == "random":
+        # drawn per file, after the file's seed is set
+        return {"velocity": lambda: [random.choice(vel_values) for _ in range(len(sk["pitch"]))]}
+    return {"velocity": np.array(vel_values)[sk["index"] % len(vel_values)]}
+
+
+# axis name -> (named values, transform(skeleton, name, value) -> note columns)
+VARIANT_AXES = {
+    "rhythm": (RHYTHM_PATTERNS, rhythm_variant),
+    "velocity": (VELOCITY_PATTERNS, velocity_variant),
+}
+
+
+def progression_items():
+    return [(prog_name, root, *labels)
+            for prog_name in PROGRESSIONS
+            for root in NOTE_NUMS
+            for labels in itertools.product(*(values for values, _ in VARIANT_AXES.values()))]
+
+
+def progression_paths(item):
+    prog_name, root, *labels = item
+    label = "_".join(labels)
+    return [os.path.join(BASE_DIR, "Progressions", prog_name, root, f"{root}_{prog_name}_{label}.mid")]
+
+
+def progression_inputs(item):
+    prog_name, _, *labels = item
+    chords = [ROMAN_TO_CHORD[roman] for roman in PROGRESSIONS[prog_name]]
+    return (item, chords, {chord_type: EXTENDED_CHORDS[chord_type] for _, chord_type in chords},
+            [values[label] for (values, _), label in zip(VARIANT_AXES.values(), labels)])
+
+
+def progression_files(item):
+    prog_name, root, *labels = item
+    sk = chord_skeleton(prog_name, root)
+    columns = {}
+    for (values, transform), label in zip(VARIANT_AXES.values(), labels):
+        columns.update(transform(sk, label, values[label]))
+    velocity = columns["velocity"]
+    velocity = velocity() if callable(velocity) else velocity.tolist()
+    notes = list(zip(sk["pitch"].tolist(), columns["start"].tolist(), columns["end"].tolist(), velocity))
+    return [(progression_paths(item)[0], [(None, notes, False)])]
+
+
+PROFILE = LibraryProfile(
+    "musicallib", BASE_DIR,
+    [
+        note_stage("scales", scale_items, scale_paths, scale_notes),
+        note_stage("modes", lambda: [(s, r, m) for s, r in scale_items() for m in LIBRARY_SCALES],
+                   mode_paths, mode_notes),
+        note_stage("arpeggios", scale_items, arpeggio_paths, arpeggio_notes),
+        note_stage("chords", lambda: [(c, r, i) for c, ints in EXTENDED_CHORDS.items()
+                                      for r in NOTE_NUMS for i in range(len(ints))],
+                   chord_paths, chord_notes),
+        # per-file seed so "random" velocities are reproducible
+        Stage("progressions", progression_items, progression_files, progression_paths,
+              progression_inputs, seed=lambda item: zlib.crc32(progression_paths(item)[0].encode())),
+    ],
+    note_nums=NOTE_NUMS,
+    version=2,   # 1 keyed its manifest by file path
+    description="Scales, modes, arpeggios, inversions and progression variants (deduplicated)",
+)
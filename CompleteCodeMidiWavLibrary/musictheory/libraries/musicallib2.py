@@ -0,0 +1,137 @@
+# musictheory/libraries/musicallib2.py
+# ============================
+# MIDILib2_Library (musicallib2.py)
+# ============================
+# Like MIDI_Library, but every track is named after its content and the
+# library adds one four-chord file per progression and root (one named track
+# per chord). Mode files repeat under every parent scale and are linked.
+
+import os
+
+from ..engine import LibraryProfile, Stage
+from ..tables import shared_tables
+from .common import EXTENDED_CHORDS, LIBRARY_SCALES, NOTE_NUMS
+
+BASE_DIR = "MIDILib2_Library"
+TABLES = shared_tables(EXTENDED_CHORDS, LIBRARY_SCALES)
+
+# Common progressions (Roman numerals)
+PROGRESSIONS = {
+    "pop": ["I", "V", "vi", "IV"],
+    "jazz_ii_V_I": ["ii", "V", "I"],
+    "blues": ["I", "IV", "V", "I"],
+    "minor_pop": ["i", "VI", "III", "VII"]
+}
+
+ROMAN_TO_CHORD = {
+    "I": (0, "major"),
+    "ii": (2, "minor"),
+    "iii": (4, "minor"),
+    "IV": (5, "major"),
+    "V": (7, "major"),
+    "vi": (9, "minor"),
+    "vii°": (11, "diminished"),
+    "i": (0, "minor"),
+    "III": (3, "major"),
+    "VI": (8, "major"),
+    "VII": (10, "major")
+}
+
+
+def scale_paths(item):
+    scale_name, root = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, f"{root}_{scale_name}.mid")]
+
+
+def scale_inputs(item):
+    return item, LIBRARY_SCALES[item[0]]
+
+
+def scale_files(item):
+    scale_name, root = item
+    notes = [(n, 0, 1, 100) for n in TABLES.scale(NOTE_NUMS[root], scale_name)]
+    return [(scale_paths(item)[0], [(f"{root}_{scale_name}_scale", notes, False)])]
+
+
+def mode_paths(item):
+    scale_name, root, mode_name = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, "Modes", mode_name, f"{root}_{mode_name}.mid")]
+
+
+def mode_inputs(item):
+    return item, LIBRARY_SCALES[item[2]]
+
+
+def mode_files(item):
+    _, root, mode_name = item
+    notes = [(n, 0, 1, 100) for n in TABLES.scale(NOTE_NUMS[root], mode_name)]
+    return [(mode_paths(item)[0], [(f"{root}_{mode_name}_mode", notes, False)])]
+
+
+def arpeggio_paths(item):
+    scale_name, root = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, "Arpeggios", f"{root}_{scale_name}_arpeggio.mid")]
+
+
+def arpeggio_files(item):
+    scale_name, root = item
+    root_midi = NOTE_NUMS[root]
+    notes = [(root_midi + i, i * 0.5, (i + 1) * 0.5, 100) for i in LIBRARY_SCALES[scale_name][::2]]
+    return [(arpeggio_paths(item)[0], [(f"{root}_{scale_name}_arpeggio", notes, False)])]
+
+
+def chord_paths(item):
+    chord_name, root = item
+    return [os.path.join(BASE_DIR, "Chords", chord_name, f"{root}_{chord_name}.mid")]
+
+
+def chord_inputs(item):
+    return item, EXTENDED_CHORDS[item[0]]
+
+
+def chord_files(item):
+    chord_name, root = item
+    notes = [(n, 0, 2, 100) for n in TABLES.chord(NOTE_NUMS[root], chord_name)]
+    return [(chord_paths(item)[0], [(f"{root}_{chord_name}_chord", notes, False)])]
+
+
+def progression_paths(item):
+    prog_name, root = item
+    return [os.path.join(BASE_DIR, "Progressions", prog_name, root, f"{root}_{prog_name}.mid")]
+
+
+def progression_inputs(item):
+    chords = [ROMAN_TO_CHORD[roman] for roman in PROGRESSIONS[item[0]]]
+    return item, chords, {chord_type: EXTENDED_CHORDS[chord_type] for _, chord_type in chords}
+
+
+def progression_files(item):
+    prog_name, root = item
+    track_data = []
+    for bar, roman in enumerate(PROGRESSIONS[prog_name]):
+        interval, chord_type = ROMAN_TO_CHORD[roman]
+        notes = [(n, bar, bar + 1, 100) for n in TABLES.chord(NOTE_NUMS[root] + interval, chord_type)]
+        track_data.append((f"{root}_{roman}_{chord_type}", notes, False))
+    return [(progression_paths(item)[0], track_data)]
+
+
+def scale_items():
+    return [(s, r) for s in LIBRARY_SCALES for r in NOTE_NUMS]
+
+
+PROFILE = LibraryProfile(
+    "musicallib2", BASE_DIR,
+    [
+        Stage("scales", scale_items, scale_files, scale_paths, scale_inputs),
+        Stage("modes", lambda: [(s, r, m) for s, r in scale_items() for m in LIBRARY_SCALES],
+              mode_files, mode_paths, mode_inputs, content=lambda item: item[1:]),
+        Stage("arpeggios", scale_items, arpeggio_files, arpeggio_paths, scale_inputs),
+        Stage("chords", lambda: [(c, r) for c in EXTENDED_CHORDS for r in NOTE_NUMS],
+              chord_files, chord_paths, chord_inputs),
+        Stage("progressions", lambda: [(p, r) for p in PROGRESSIONS for r in NOTE_NUMS],
+              progression_files, progression_paths, progression_inputs),
+    ],
+    note_nums=NOTE_NUMS,
+    version=2,   # 1 keyed its manifest by file path
+    description="Named-track scales, modes, arpeggios, chords and progressions",
+)
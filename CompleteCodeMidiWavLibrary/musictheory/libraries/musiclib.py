@@ -0,0 +1,112 @@
+# musictheory/libraries/musiclib.py
+# ============================
+# Complete_MIDI_Library (musiclib.py)
+# ============================
+# Per root: every diatonic mode, every basic chord, a 16-bar arpeggio cycling
+# through the chord's inversions, and three example progressions that pick a
+# random chord quality for each step.
+
+import itertools
+import os
+import random
+
+from ..engine import LibraryProfile, Stage
+from ..tables import shared_tables
+from .common import BASIC_CHORDS, DIATONIC_MODES, NOTE_NUMS, ROOTS, sequence
+
+BASE_DIR = "Complete_MIDI_Library"
+TABLES = shared_tables(BASIC_CHORDS, DIATONIC_MODES)
+
+SCALE_REPEATS = 2
+ARPEGGIO_BARS = 16
+BEATS_PER_PROGRESSION_NOTE = 4
+EXAMPLE_PROGRESSIONS = [
+    ["C", "F", "G", "C"],
+    ["Am", "Dm", "G", "C"],
+    ["C", "Am", "F", "G"]
+]
+
+
+def scale_paths(item):
+    root, scale_name = item
+    return [os.path.join(BASE_DIR, "Scales", root, f"{scale_name}.mid")]
+
+
+def scale_inputs(item):
+    return item, DIATONIC_MODES[item[1]], SCALE_REPEATS
+
+
+def scale_files(item):
+    root, scale_name = item
+    notes = TABLES.scale(NOTE_NUMS[root], scale_name) * SCALE_REPEATS
+    return [(scale_paths(item)[0], [(None, sequence(notes), False)])]
+
+
+def chord_paths(item):
+    root, chord_name = item
+    return [os.path.join(BASE_DIR, "Chords", root, f"{chord_name}.mid")]
+
+
+def chord_inputs(item):
+    return item, BASIC_CHORDS[item[1]]
+
+
+def chord_files(item):
+    root, chord_name = item
+    notes = TABLES.chord(NOTE_NUMS[root], chord_name)
+    return [(chord_paths(item)[0], [(None, sequence(notes), False)])]
+
+
+def arpeggio_paths(item):
+    root, chord_name = item
+    return [os.path.join(BASE_DIR, "Arpeggios", root, f"{chord_name}_arpeggio.mid")]
+
+
+def arpeggio_inputs(item):
+    return item, BASIC_CHORDS[item[1]], ARPEGGIO_BARS
+
+
+def arpeggio_files(item):
+    root, chord_name = item
+    # every inversion in turn, low to high, until the bars are filled
+    cycle = [pitch for inversion in range(len(BASIC_CHORDS[chord_name]))
+             for pitch in sorted(TABLES.chord(NOTE_NUMS[root], chord_name, inversion))]
+    notes = list(itertools.islice(itertools.cycle(cycle), ARPEGGIO_BARS * 4))
+    return [(arpeggio_paths(item)[0], [(None, sequence(notes), False)])]
+
+
+def progression_paths(item):
+    root, index = item
+    return [os.path.join(BASE_DIR, "Progressions", root, f"progression_{index + 1}.mid")]
+
+
+def progression_inputs(item):
+    # each step picks from every chord quality
+    return item, EXAMPLE_PROGRESSIONS[item[1]], BASIC_CHORDS, BEATS_PER_PROGRESSION_NOTE
+
+
+def progression_files(item):
+    _, index = item
+    notes = []
+    for chord_root in EXAMPLE_PROGRESSIONS[index]:
+        chord_type = random.choice(list(BASIC_CHORDS))
+        notes += TABLES.chord(NOTE_NUMS[chord_root[0]], chord_type)
+    return [(progression_paths(item)[0],
+             [(None, sequence(notes, (BEATS_PER_PROGRESSION_NOTE,)), False)])]
+
+
+PROFILE = LibraryProfile(
+    "musiclib", BASE_DIR,
+    [
+        Stage("scales", lambda: [(r, s) for r in ROOTS for s in DIATONIC_MODES], scale_files, scale_paths,
+              scale_inputs),
+        Stage("chords", lambda: [(r, c) for r in ROOTS for c in BASIC_CHORDS], chord_files, chord_paths,
+              chord_inputs),
+        Stage("arpeggios", lambda: [(r, c) for r in ROOTS for c in BASIC_CHORDS],
+              arpeggio_files, arpeggio_paths, arpeggio_inputs),
+        Stage("progressions", lambda: [(r, i) for r in ROOTS for i in range(len(EXAMPLE_PROGRESSIONS))],
+              progression_files, progression_paths, progression_inputs),
+    ],
+    note_nums=NOTE_NUMS,
+    description="Scales, chords, arpeggios and example progressions per root",
+)
@@ -0,0 +1,367 @@
+# musictheory/libraries/musiclibtotal.py
+# ============================
+# MIDITOTAL_Library (musiclibtotal.py)
+# ============================
+# The full library: scales with arpeggios, chord inversions, genre
+# progressions arranged for a band (block chords, arpeggio, bass and drums in
+# three grooves, looped twice) and a few demo songs. The genres, progressions,
+# grooves, drum kit, bass patterns and song forms below are this library's
+# own; the drum/bass/melody builders (musictheory.arranger), numeral parsing
+# (musictheory.theory) and humanization (musictheory.utils) are the package's.
+# Every track is humanized with swing plus timing and velocity jitter from the
+# Generator the engine seeds per item. Scales, chords and progressions are
+# transposable, so --template renders one root per item and transposes the
+# other eleven.
+
+import os
+
+from ..arranger import bass_track_for_genre, drum_track_for_genre, generate_melody
+from ..engine import LibraryProfile, Stage
+from ..instrument import timer
+from ..notes import shift_notes_time
+from ..tables import shared_tables
+from ..theory import roman_to_midi_progression
+from ..utils import humanization_profile, humanize_notes
+from .common import EXTENDED_CHORDS, LIBRARY_SCALES, NOTE_NUMS, RHYTHM_PATTERNS
+
+BASE_DIR = "MIDITOTAL_Library"
+
+# =========================
+# CONFIG & THEORY DATA
+# =========================
+CHORD_FORMULAS = EXTENDED_CHORDS
+
+SCALES = {
+    **LIBRARY_SCALES,
+    # a few extras
+    "pentatonic_major":[0,2,4,7,9], "pentatonic_minor":[0,3,5,7,10],
+    "whole_tone":[0,2,4,6,8,10]
+}
+
+# Genre → progression templates
+PROGRESSIONS = {
+    "jazz_ii-V-I": ["ii","V","I"],
+    "jazz_iii-VI-ii-V": ["iii","VI","ii","V"],
+    "jazz_turnaround": ["I","vi","ii","V"],
+
+    "pop_I-V-vi-IV": ["I","V","vi","IV"],
+    "pop_vi-IV-I-V": ["vi","IV","I","V"],
+    "pop_IV-I-V-vi": ["IV","I","V","vi"],
+
+    "blues_I-IV-V": ["I","IV","V","I"],
+    "blues_quick_change": ["I","IV","I","V","IV","I"],
+
+    "funk_i-bVII-IV": ["i","bVII","IV"],
+    "funk_I-bIII-IV": ["I","bIII","IV"],
+
+    "edm_vi-IV-I-V": ["vi","IV","I","V"],
+    "edm_I-V-vi-IV": ["I","V","vi","IV"],
+
+    "latin_I-IV-V-IV": ["I","IV","V","IV"],
+    "latin_ii-V-I": ["ii","V","I"],
+
+    "orch_I-V-vi-iii-IV-I-IV-V": ["I","V","vi","iii","IV","I","IV","V"],
+    "orch_vi-IV-I-V": ["vi","IV","I","V"],
+}
+
+# Genre collections (for foldering)
+GENRES = {
+    "Jazz": ["jazz_ii-V-I","jazz_iii-VI-ii-V","jazz_turnaround"],
+    "Pop": ["pop_I-V-vi-IV","pop_vi-IV-I-V","pop_IV-I-V-vi"],
+    "Blues": ["blues_I-IV-V","blues_quick_change"],
+    "Funk": ["funk_i-bVII-IV","funk_I-bIII-IV"],
+    "EDM": ["edm_vi-IV-I-V","edm_I-V-vi-IV"],
+    "Latin": ["latin_I-IV-V-IV","latin_ii-V-I"],
+    "Orchestral": ["orch_I-V-vi-iii-IV-I-IV-V","orch_vi-IV-I-V"],
+}
+
+# Drum map (GM)
+DRUMS = {"kick":36,"snare":38,"closed_hat":42,"open_hat":46,"ride":51,"crash":49}
+
+# Genre drum grooves: list of (drum_name, beat_position) per 4/4 bar
+DRUM_GROOVES = {
+    "pop": [
+        ("kick",0.0),("kick",1.5),
+        ("snare",1.0),("snare",3.0),
+        *[("closed_hat",x*0.5) for x in range(8)]  # 8ths
+    ],
+    "rock": [
+        ("kick",0.0),("kick",2.0),
+        ("snare",1.0),("snare",3.0),
+        *[("closed_hat",x*0.5) for x in range(8)]
+    ],
+    "jazz": [
+        ("ride",0.0),("ride",1.0),("ride",2.0),("ride",3.0),
+        ("ride",0.5),("ride",2.5), ("snare",2.0), ("kick",0.0),("kick",2.0)
+    ],
+    "funk": [
+        ("kick",0.0),("kick",1.5),("kick",2.5),
+        ("snare",1.0),("snare",2.0),("snare",3.0),
+        *[("closed_hat",i*0.25) for i in range(16)]  # 16ths
+    ],
+    "edm": [
+        ("kick",0.0),("kick",1.0),("kick",2.0),("kick",3.0),
+        *[("closed_hat",x*0.5+0.25) for x in range(8)], # off 8ths
+        ("snare",1.0),("snare",3.0)
+    ],
+    "latin": [
+        ("kick",0.0),("kick",2.0),
+        ("snare",2.5),
+        ("closed_hat",1.0),("closed_hat",1.5),("closed_hat",3.0),("closed_hat",3.5),
+        ("ride",0.0),("ride",2.0)
+    ],
+    "orchestral": [
+        ("kick",0.0),("kick",2.0),
+        ("snare",3.0),("crash",0.0)
+    ]
+}
+
+# Bass patterns: semitone offsets from chord root on each beat in a bar
+BASS_PATTERNS = {
+    "pop":[0,0,0,0],
+    "rock":[0,7,0,7],
+    "jazz":[0,4,7,11],     # R-3-5-7 (walking)
+    "funk":[0,7,0,5],
+    "edm":[0,0,0,0],
+    "latin":[0,7,5,7],
+    "orchestral":[0,0,7,0],
+}
+
+# Song structure templates
+SONG_STRUCTURES = {
+    "pop": ["intro","verse","chorus","verse","chorus","bridge","chorus","outro"],
+    "jazz": ["intro","head","solo","head","outro"],
+    "blues": ["intro","chorus","chorus","solo","chorus","outro"]
+}
+
+# Section → default progression (fallbacks)
+SECTION_PROGS = {
+    "intro":["I","V","vi","IV"],
+    "verse":["I","V","vi","IV"],
+    "chorus":["vi","IV","I","V"],
+    "bridge":["IV","V","iii","vi"],
+    "head":["ii","V","I","I"],
+    "solo":["ii","V","I","I"],
+    "chorus_blues":["I","I","I","I","IV","IV","I","I","V","IV","I","V"],
+    "outro":["I","I","I","I"]
+}
+
+PROGRESSION_GROOVES = ["straight","swing","syncopated"]
+
+# Comping durations inside a bar, by song genre
+COMPING_PATTERNS = {"pop":[1,1,1,1], "jazz":[0.5,0.5,1,1], "blues":[1,1,1,1]}
+DEFAULT_COMPING = [1,1,1,1]
+
+# Inversions and chord voicings for every root, computed once
+TABLES = shared_tables(CHORD_FORMULAS, SCALES)
+
+
+def humanize(notes, rng):
+    return humanize_notes(notes, rng=rng)
+
+
+# utils' default profile: off-beat swing, timing and +/- velocity jitter
+HUMANIZE_PARAMS = humanization_profile()
+
+# =========================
+# THEORY LIBRARY (scales/chords/arps)
+# =========================
+def scale_paths(item):
+    scale_name, root_name = item
+    return [os.path.join(BASE_DIR,"Scales",scale_name,root_name,f"{root_name}_{scale_name}.mid"),
+            os.path.join(BASE_DIR,"Scales",scale_name,root_name,"Arpeggios",
+                         f"{root_name}_{scale_name}_arp.mid")]
+
+def scale_files(item):
+    scale_name, root_name = item
+    intervals = SCALES[scale_name]
+    root_midi = NOTE_NUMS[root_name]
+    path, path_arp = scale_paths(item)
+    # scale
+    scale_notes = [(root_midi+i, i*0.25, i*0.25+0.5, 100) for i in intervals]
+    # arpeggio (every other)
+    arp_ints = intervals[::2]
+    arp_notes = [(root_midi+i, idx*0.5, idx*0.5+0.5, 100) for idx,i in enumerate(arp_ints)]
+    return [(path, [(f"{root_name}_{scale_name}_scale", scale_notes, False)]),
+            (path_arp, [(f"{root_name}_{scale_name}_arpeggio", arp_notes, False)])]
+
+def chord_paths(item):
+    chord_name, root_name, inv_i = item
+    return [os.path.join(BASE_DIR,"Chords",chord_name,f"Inversion_{inv_i}",
+                         f"{root_name}_{chord_name}_inv{inv_i}.mid")]
+
+def chord_files(item):
+    chord_name, root_name, inv_i = item
+    pitches = TABLES.chord(NOTE_NUMS[root_name], chord_name, inv_i)
+    chord_notes = [(p, 0.0, 2.0, 100) for p in pitches]
+    path, = chord_paths(item)
+    return [(path, [(f"{root_name}_{chord_name}_inv{inv_i}", chord_notes, False)])]
+
+def scale_inputs(item):
+    scale_name, root_name = item
+    return SCALES[scale_name], NOTE_NUMS[root_name]
+
+def chord_inputs(item):
+    chord_name, root_name, inv_i = item
+    return CHORD_FORMULAS[chord_name], NOTE_NUMS[root_name], inv_i
+
+def scale_items():
+    return [(scale_name, root_name)
+            for scale_name in SCALES
+            for root_name in NOTE_NUMS]
+
+def chord_items():
+    return [(chord_name, root_name, inv_i)
+            for chord_name, ints in CHORD_FORMULAS.items()
+            for root_name in NOTE_NUMS
+            for inv_i in range(len(ints))]
+
+# =========================
+# PROGRESSIONS (block + arp + bass + drums) with grooves & loops
+# =========================
+def block_track_from_chords(chords_by_bar, groove="straight", vel=100):
+    track = []
+    time = 0.0
+    pattern = RHYTHM_PATTERNS.get(groove, [1.0])
+    for chord in chords_by_bar:
+        dur = pattern[0] if pattern else 1.0
+        for n in chord:
+            track.append((n, time, time+dur, vel))
+        time += sum(pattern) if pattern else 1.0
+    return track
+
+def arp_track_from_chords(chords_by_bar, groove="straight", vel=96):
+    track = []
+    time = 0.0
+    pattern = RHYTHM_PATTERNS.get(groove, [0.25]*4)
+    for chord in chords_by_bar:
+        for i, n in enumerate(chord):
+            dur = pattern[i % len(pattern)]
+            track.append((n, time, time+dur, vel))
+            time += dur
+    return track
+
+def progression_paths(item):
+    genre, prog_name, root_name = item
+    return [os.path.join(BASE_DIR, "Progressions_Full", genre, prog_name, root_name,
+                         f"{root_name}_{prog_name}.mid")]
+
+def progression_files(item):
+    genre, prog_name, root_name = item
+    chords_one_pass = roman_to_midi_progression(PROGRESSIONS[prog_name], NOTE_NUMS[root_name])
+    # loop twice
+    chords_two_loops = chords_one_pass + chords_one_pass
+    bars = len(chords_two_loops)
+
+    track_data = []
+    # multiple groove variants in the SAME file
+    for groove in PROGRESSION_GROOVES:
+        with timer("tracks"):
+            block = block_track_from_chords(chords_two_loops, groove=groove, vel=100)
+            arp = arp_track_from_chords(chords_two_loops, groove=groove, vel=95)
+            bass = bass_track_for_genre(chords_two_loops, genre.lower(), base_vel=86,
+                                        patterns=BASS_PATTERNS)
+            drums = drum_track_for_genre(genre.lower(), bars, velocity=92,
+                                         grooves=DRUM_GROOVES, drums=DRUMS)
+
+        track_data.extend([
+            (f"{root_name}_{prog_name}_block_{groove}", block, False),
+            (f"{root_name}_{prog_name}_arp_{groove}", arp, False),
+            (f"{root_name}_{prog_name}_bass_{groove}", bass, False),
+            (f"{root_name}_{prog_name}_drums_{groove}", drums, True),
+        ])
+
+    path, = progression_paths(item)
+    return [(path, track_data)]
+
+def progression_inputs(item):
+    genre, prog_name, root_name = item
+    g = genre.lower()
+    return (PROGRESSIONS[prog_name], roman_to_midi_progression(PROGRESSIONS[prog_name], NOTE_NUMS[root_name]),
+            {r: RHYTHM_PATTERNS.get(r) for r in PROGRESSION_GROOVES},
+            BASS_PATTERNS.get(g, BASS_PATTERNS["pop"]), DRUM_GROOVES.get(g, DRUM_GROOVES["pop"]), DRUMS)
+
+def progression_items():
+    return [(genre, prog_name, root_name)
+            for genre, prog_list in GENRES.items()
+            for prog_name in prog_list
+            for root_name in NOTE_NUMS]
+
+# =========================
+# DEMO SONGS
+# =========================
+def generate_comping(chords_by_bar, pattern=DEFAULT_COMPING, vel=92, start_time=0.0):
+    """Hit the full chord with the given durations pattern inside each bar."""
+    notes = []
+    t = start_time
+    for chord in chords_by_bar:
+        for dur in pattern:
+            for n in chord:
+                notes.append((n, t, t+dur, vel))
+            t += dur
+    return notes
+
+def song_scale(genre):
+    return SCALES["dorian"] if genre == "jazz" else SCALES["major"]
+
+def song_sections(root_name, genre):
+    """[(section, chords per bar)] following the genre's song structure."""
+    structure = SONG_STRUCTURES.get(genre, SONG_STRUCTURES["pop"])
+    return [(section, roman_to_midi_progression(SECTION_PROGS.get(section, SECTION_PROGS["verse"]),
+                                                NOTE_NUMS[root_name]))
+            for section in structure]
+
+def song_files(item):
+    root_name, genre, filename = item
+    root_midi = NOTE_NUMS[root_name]
+    scale = song_scale(genre)
+    comp_pat = COMPING_PATTERNS.get(genre, DEFAULT_COMPING)
+    midi_tracks = []
+    current_time = 0.0
+
+    for section, chords in song_sections(root_name, genre):
+        with timer("tracks"):
+            piano = shift_notes_time(generate_comping(chords, comp_pat, vel=92), current_time)
+            bass = shift_notes_time(bass_track_for_genre(chords, genre, base_vel=84,
+                                                         patterns=BASS_PATTERNS), current_time)
+            drums = shift_notes_time(drum_track_for_genre(genre, len(chords), velocity=90,
+                                                          grooves=DRUM_GROOVES, drums=DRUMS), current_time)
+            melody = shift_notes_time(generate_melody(chords, scale, root_midi), current_time)
+
+        midi_tracks.extend([
+            (f"{section}_piano", piano, False),
+            (f"{section}_bass", bass, False),
+            (f"{section}_drums", drums, True),
+            (f"{section}_melody", melody, False),
+        ])
+        current_time += len(chords)  # next section after these bars
+
+    return [(filename, midi_tracks)]
+
+DEMO_SONGS = [
+    ("C", "pop", os.path.join(BASE_DIR,"Songs","Pop","C_pop_song.mid")),
+    ("F", "jazz", os.path.join(BASE_DIR,"Songs","Jazz","F_jazz_song.mid")),
+    ("A", "blues", os.path.join(BASE_DIR,"Songs","Blues","A_blues_song.mid")),
+]
+
+def song_inputs(item):
+    root_name, genre, _ = item
+    return (item, song_sections(root_name, genre), song_scale(genre),
+            COMPING_PATTERNS.get(genre, DEFAULT_COMPING),
+            BASS_PATTERNS.get(genre, BASS_PATTERNS["pop"]), DRUM_GROOVES.get(genre, DRUM_GROOVES["pop"]), DRUMS)
+
+
+PROFILE = LibraryProfile(
+    "musiclibtotal", BASE_DIR,
+    [
+        Stage("scales", scale_items, scale_files, scale_paths, scale_inputs, root=1),
+        Stage("chords", chord_items, chord_files, chord_paths, chord_inputs, root=1),
+        Stage("progressions", progression_items, progression_files, progression_paths,
+              progression_inputs, root=2),
+        Stage("songs", lambda: DEMO_SONGS, song_files, lambda item: [item[2]], song_inputs),
+    ],
+    note_nums=NOTE_NUMS,
+    humanize=humanize,
+    humanize_params=HUMANIZE_PARAMS,
+    description="Humanized theory library, full-band genre progressions and demo songs",
+)
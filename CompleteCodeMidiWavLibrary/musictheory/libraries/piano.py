@@ -0,0 +1,123 @@
+# musictheory/libraries/piano.py
+# ============================
+# Two-hand piano libraries (pianofull.py, pianorythmn.py)
+# ============================
+# Rhythmic_Piano_MIDI has a file per root and chord: chord tones in the right
+# hand and the root an octave down in the left, both with random rhythms.
+# Full_Piano_Practice_Library adds a random melody per root and scale and a
+# counterpoint a third or fifth below it.
+
+import functools
+import os
+import random
+
+from ..engine import LibraryProfile, Stage
+from ..tables import shared_tables
+from .common import BASIC_CHORDS, DIATONIC_MODES, NOTE_NUMS, ROOTS
+
+FULL_DIR = "Full_Piano_Practice_Library"
+RHYTHMIC_DIR = "Rhythmic_Piano_MIDI"
+TABLES = shared_tables(BASIC_CHORDS, DIATONIC_MODES)
+
+RHYTHM_VALUES = [0.5, 1, 1.5, 2]   # eighth, quarter, dotted, half
+LEFT_VELOCITY = 90
+RIGHT_VELOCITY = 100
+CHORD_BARS = 16
+MELODY_LENGTH = 16
+
+
+def two_hands(left, right):
+    """(pitch, beats) lists for each hand -> track_data.
+
+    The hands take turns: each left-hand note moves time on, and the matching
+    right-hand note starts where that left-hand note ends.
+    """
+    left_notes, right_notes = [], []
+    time = 0
+    for i in range(max(len(left), len(right))):
+        if i < len(left):
+            pitch, duration = left[i]
+            left_notes.append((pitch, time, time + duration, LEFT_VELOCITY))
+            time += duration
+        if i < len(right):
+            pitch, duration = right[i]
+            right_notes.append((pitch, time, time + duration, RIGHT_VELOCITY))
+    return [(None, left_notes, False), (None, right_notes, False)]
+
+
+def chord_inputs(item):
+    return item, BASIC_CHORDS[item[1]], RHYTHM_VALUES, CHORD_BARS, LEFT_VELOCITY, RIGHT_VELOCITY
+
+
+def chord_paths(base_dir, item):
+    root, chord_name = item
+    return [os.path.join(base_dir, "Chords", root, f"{chord_name}_two_hand.mid")]
+
+
+def chord_files(base_dir, item):
+    root, chord_name = item
+    notes = TABLES.chord(NOTE_NUMS[root], chord_name)
+    total_beats = CHORD_BARS * 4
+    right, beats = [], 0
+    while beats < total_beats:
+        duration = random.choice(RHYTHM_VALUES)
+        for pitch in notes:
+            right.append((pitch, duration))
+            beats += duration
+    left, beats = [], 0
+    while beats < total_beats:
+        duration = random.choice(RHYTHM_VALUES)
+        left.append((notes[0] - 12, duration))
+        beats += duration
+    return [(chord_paths(base_dir, item)[0], two_hands(left, right))]
+
+
+def melody_paths(item):
+    root, scale_name = item
+    return [os.path.join(FULL_DIR, "Melodies", root, f"{scale_name}_melody.mid"),
+            os.path.join(FULL_DIR, "Counterpoint", root, f"{scale_name}_counterpoint.mid")]
+
+
+def melody_inputs(item):
+    return item, DIATONIC_MODES[item[1]], RHYTHM_VALUES, MELODY_LENGTH, RIGHT_VELOCITY
+
+
+def melody_files(item):
+    root, scale_name = item
+    notes = TABLES.scale(NOTE_NUMS[root], scale_name)
+    melody = [(random.choice(notes), random.choice(RHYTHM_VALUES)) for _ in range(MELODY_LENGTH)]
+    # harmonize a third or a fifth below
+    counter = [(pitch - 4 if random.random() < 0.5 else pitch - 7, duration) for pitch, duration in melody]
+    melody_path, counter_path = melody_paths(item)
+    return [(melody_path, two_hands([], melody)), (counter_path, two_hands([], counter))]
+
+
+def chord_stage(base_dir):
+    return Stage("chords", lambda: [(r, c) for r in ROOTS for c in BASIC_CHORDS],
+                 functools.partial(chord_files, base_dir), functools.partial(chord_paths, base_dir),
+                 chord_inputs)
+
+
+def empty_folders(categories):
+    """Category/root folders the original scripts created without filling."""
+    return [os.path.join(category, root) for category in categories for root in ROOTS]
+
+
+RHYTHMIC_PROFILE = LibraryProfile(
+    "pianorythmn", RHYTHMIC_DIR, [chord_stage(RHYTHMIC_DIR)],
+    note_nums=NOTE_NUMS,
+    folders=empty_folders(["Scales", "Arpeggios", "Progressions"]),
+    description="Two-hand chords with random rhythms",
+)
+
+FULL_PROFILE = LibraryProfile(
+    "pianofull", FULL_DIR,
+    [
+        chord_stage(FULL_DIR),
+        Stage("melodies", lambda: [(r, s) for r in ROOTS for s in DIATONIC_MODES], melody_files, melody_paths,
+              melody_inputs),
+    ],
+    note_nums=NOTE_NUMS,
+    folders=empty_folders(["Scales", "Arpeggios", "Progressions"]),
+    description="Two-hand chords plus melodies with counterpoint",
+)
@@ -0,0 +1,96 @@
+# musictheory/libraries/simplemusictheory.py
+# ============================
+# MIDI_Library (simplemusictheory.py)
+# ============================
+# Every scale per root, with each mode and a skip-one arpeggio filed under it,
+# and every chord inversion per root. The mode files are the same under every
+# parent scale, so they are generated once and linked (content dedup).
+
+import os
+
+from ..engine import LibraryProfile, Stage
+from ..tables import shared_tables
+from .common import EXTENDED_CHORDS, LIBRARY_SCALES, NOTE_NUMS, RHYTHM_PATTERNS, sequence
+
+BASE_DIR = "MIDI_Library"
+TABLES = shared_tables(EXTENDED_CHORDS, LIBRARY_SCALES)
+
+RHYTHM = RHYTHM_PATTERNS["straight"]
+VELOCITY = 100
+
+
+def midi_file(path, notes):
+    return [(path, [(None, sequence(notes, RHYTHM, VELOCITY), False)])]
+
+
+def scale_inputs(item):
+    return item, LIBRARY_SCALES[item[0]], RHYTHM, VELOCITY
+
+
+def scale_paths(item):
+    scale_name, root = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, f"{root}_{scale_name}.mid")]
+
+
+def scale_files(item):
+    scale_name, root = item
+    return midi_file(scale_paths(item)[0], TABLES.scale(NOTE_NUMS[root], scale_name))
+
+
+def mode_paths(item):
+    scale_name, root, mode_name = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, "Modes", mode_name, f"{root}_{mode_name}.mid")]
+
+
+def mode_inputs(item):
+    return item, LIBRARY_SCALES[item[2]], RHYTHM, VELOCITY
+
+
+def mode_files(item):
+    _, root, mode_name = item
+    return midi_file(mode_paths(item)[0], TABLES.scale(NOTE_NUMS[root], mode_name))
+
+
+def arpeggio_paths(item):
+    scale_name, root = item
+    return [os.path.join(BASE_DIR, "Scales", scale_name, root, "Arpeggios", f"{root}_{scale_name}_arpeggio.mid")]
+
+
+def arpeggio_files(item):
+    scale_name, root = item
+    return midi_file(arpeggio_paths(item)[0], TABLES.scale(NOTE_NUMS[root], scale_name)[::2])
+
+
+def chord_paths(item):
+    chord_name, root, inversion = item
+    return [os.path.join(BASE_DIR, "Chords", chord_name, f"Inversion_{inversion}",
+                         f"{root}_{chord_name}_inv{inversion}.mid")]
+
+
+def chord_inputs(item):
+    return item, EXTENDED_CHORDS[item[0]], RHYTHM, VELOCITY
+
+
+def chord_files(item):
+    chord_name, root, inversion = item
+    return midi_file(chord_paths(item)[0], TABLES.chord(NOTE_NUMS[root], chord_name, inversion))
+
+
+def scale_items():
+    return [(s, r) for s in LIBRARY_SCALES for r in NOTE_NUMS]
+
+
+PROFILE = LibraryProfile(
+    "simplemusictheory", BASE_DIR,
+    [
+        Stage("scales", scale_items, scale_files, scale_paths, scale_inputs),
+        Stage("modes", lambda: [(s, r, m) for s, r in scale_items() for m in LIBRARY_SCALES],
+              mode_files, mode_paths, mode_inputs, content=lambda item: TABLES.scale(NOTE_NUMS[item[1]], item[2])),
+        Stage("arpeggios", scale_items, arpeggio_files, arpeggio_paths, scale_inputs),
+        Stage("chords", lambda: [(c, r, i) for c, ints in EXTENDED_CHORDS.items()
+                                 for r in NOTE_NUMS for i in range(len(ints))],
+              chord_files, chord_paths, chord_inputs),
+    ],
+    note_nums=NOTE_NUMS,
+    description="Scales with modes and arpeggios, chords in every inversion",
+)
@@ -0,0 +1,167 @@
+# musictheory/manifest.py
+# ============================
+# Content-addressed build manifest for incremental library builds
+# ============================
+# The manifest maps each work item key to the hash of everything that shapes
+# its output (theory table entries, root, rhythm/velocity pattern, seed and
+# generator version) plus the files it wrote. A rebuild skips items whose hash
+# is unchanged and whose files still exist, and deletes the files of items that
+# are no longer produced at all.
+#
+# Completions are also checkpointed to an append-only journal as the build
+# runs. save() folds them into the manifest and removes the journal; if the
+# build dies first, the next incremental run replays the journal and resumes
+# where it stopped instead of starting over.
+
+import hashlib
+import json
+import os
+
+
+def manifest_path(base_dir):
+    """The manifest lives next to the library directory, not inside it."""
+    return os.path.normpath(base_dir) + ".manifest.json"
+
+
+def journal_path(base_dir):
+    return os.path.normpath(base_dir) + ".manifest.journal"
+
+
+def estimate_rows(jobs, base_dir):
+    """Group (path, notes, bytes, stale) jobs by top-level library folder into
+    format_estimate rows."""
+    rows = {}
+    for path, notes, size, stale in jobs:
+        stage = os.path.relpath(path, base_dir).split(os.sep)[0]
+        row = rows.setdefault(stage, [stage, 0, 0, 0, 0])
+        row[1] += 1
+        row[2] += notes
+        row[3] += size
+        row[4] += bool(stale)
+    return [tuple(row) for row in rows.values()]
+
+
+def format_estimate(rows):
+    """Dry-run table for rows of (stage, files, notes, bytes, remaining files)."""
+    lines = [f"   {'stage':<14}{'files':>8}{'notes':>10}{'~MB':>9}{'to build':>10}"]
+    for stage, files, notes, size, remaining in rows:
+        lines.append(f"   {stage:<14}{files:>8}{notes:>10}{size / 1e6:>9.2f}{remaining:>10}")
+    totals = [sum(row[i] for row in rows) for i in range(1, 5)]
+    lines.append(f"   {'total':<14}{totals[0]:>8}{totals[1]:>10}{totals[2] / 1e6:>9.2f}{totals[3]:>10}")
+    return "\n".join(lines)
+
+
+class BuildManifest:
+    def __init__(self, base_dir, version=1, enabled=True, checkpoint_every=64, flush=None):
+        """flush: called before completions are journaled (e.g. to drain a
+        writer pool), so the journal only names files that are on disk."""
+        self.base_dir = base_dir
+        self.path = manifest_path(base_dir)
+        self.journal = journal_path(base_dir)
+        self.version = version
+        self.enabled = enabled
+        self.checkpoint_every = checkpoint_every
+        self.flush = flush
+        self.entries = {}
+        self.pending = []
+        self.seen = set()
+        self.built = self.skipped = self.pruned = self.resumed = 0
+        if enabled and os.path.exists(self.path):
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") == version:
+                self.entries = data.get("items", {})
+        if enabled:
+            self._replay()
+
+    def _replay(self):
+        """Apply completions journaled by an interrupted build."""
+        if not os.path.exists(self.journal):
+            return
+        with open(self.journal) as f:
+            for line in f:
+                try:
+                    version, key, digest, outputs = json.loads(line)
+                except ValueError:
+                    break   # torn last line from a crash
+                if version == self.version:
+                    self.entries[key] = {"hash": digest, "outputs": outputs}
+                    self.resumed += 1
+
+    def digest(self, *inputs):
+        """Stable hash of a work item's inputs (any JSON-able values)."""
+        blob = json.dumps([self.version, inputs], sort_keys=True, default=repr)
+        return hashlib.sha1(blob.encode()).hexdigest()
+
+    def up_to_date(self, key, digest):
+        """True if `key` was built from the same inputs and its files still exist."""
+        self.seen.add(key)
+        entry = self.entries.get(key)
+        if (self.enabled and entry and entry["hash"] == digest
+                and all(os.path.exists(p) for p in entry["outputs"])):
+            self.skipped += 1
+            return True
+        return False
+
+    def record(self, key, digest, outputs):
+        self.seen.add(key)
+        self.built += 1
+        if self.enabled:
+            self.entries[key] = {"hash": digest, "outputs": list(outputs)}
+            self.pending.append((key, digest, list(outputs)))
+            if len(self.pending) >= self.checkpoint_every:
+                self.checkpoint()
+
+    def checkpoint(self):
+        """Append completions recorded since the last checkpoint to the journal."""
+        if not (self.enabled and self.pending):
+            return
+        if self.flush is not None:
+            self.flush()
+        with open(self.journal, "a") as f:
+            for key, digest, outputs in self.pending:
+                f.write(json.dumps([self.version, key, digest, outputs]) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.pending = []
+
+    def prune_orphans(self):
+        """Delete outputs of items that were not part of this build.
+
+        A path that a built item still lists (e.g. a file that moved between
+        a deduplicated alias and its canonical item) is kept.
+        """
+        if not self.enabled:
+            return 0
+        live = {path for key in self.seen if key in self.entries
+                for path in self.entries[key]["outputs"]}
+        for key in [k for k in self.entries if k not in self.seen]:
+            for path in self.entries.pop(key)["outputs"]:
+                if path not in live and os.path.exists(path):
+                    os.remove(path)
+                    self.pruned += 1
+                self._remove_empty_dirs(os.path.dirname(path))
+        return self.pruned
+
+    def _remove_empty_dirs(self, directory):
+        base = os.path.abspath(self.base_dir)
+        directory = os.path.abspath(directory)
+        while (directory.startswith(base + os.sep) and os.path.isdir(directory)
+               and not os.listdir(directory)):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
+
+    def save(self):
+        if not self.enabled:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": self.version, "items": self.entries}, f, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.pending = []
+        if os.path.exists(self.journal):
+            os.remove(self.journal)
+
+    def summary(self):
+        resumed = f" ({self.resumed} resumed from an interrupted build)" if self.resumed else ""
+        return f"{self.built} built, {self.skipped} unchanged{resumed}, {self.pruned} orphaned files removed"
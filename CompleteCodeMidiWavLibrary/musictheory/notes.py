@@ -0,0 +1,69 @@
+# musictheory/notes.py
+# ============================
+# Columnar note container
+# ============================
+# A track is a NumPy structured array with one 18-byte record per note instead
+# of a list of (pitch, start, end, vel) tuples. Offsets, transposition and
+# velocity scaling are single vector operations, and .tolist() still yields the
+# familiar tuples for code that iterates notes one by one.
+
+import numpy as np
+
+NOTE_DTYPE = np.dtype([
+    ("pitch", np.uint8),
+    ("start", np.float64),
+    ("end", np.float64),
+    ("velocity", np.uint8),
+])
+
+
+def make_notes(pitch, start, end, velocity):
+    """Build a note array from columns; scalars broadcast to the longest column."""
+    pitch, start, end, velocity = np.broadcast_arrays(pitch, start, end, velocity)
+    notes = np.empty(pitch.shape[0] if pitch.ndim else 1, dtype=NOTE_DTYPE)
+    notes["pitch"] = pitch
+    notes["start"] = start
+    notes["end"] = end
+    notes["velocity"] = velocity
+    return notes
+
+
+def note_array(notes):
+    """Coerce tuples, an (n, 4) array or a note array to a note array."""
+    if isinstance(notes, np.ndarray) and notes.dtype == NOTE_DTYPE:
+        return notes
+    if isinstance(notes, np.ndarray):
+        notes = notes.tolist()
+    out = np.empty(len(notes), dtype=NOTE_DTYPE)
+    if len(notes):
+        pitch, start, end, velocity = zip(*notes)
+        out["pitch"], out["start"], out["end"], out["velocity"] = pitch, start, end, velocity
+    return out
+
+
+def empty_notes():
+    return np.empty(0, dtype=NOTE_DTYPE)
+
+
+def concat_notes(tracks):
+    tracks = [note_array(t) for t in tracks]
+    return np.concatenate(tracks) if tracks else empty_notes()
+
+
+def shift_notes_time(notes, offset):
+    out = note_array(notes).copy()
+    out["start"] += offset
+    out["end"] += offset
+    return out
+
+
+def transpose_notes(notes, semitones):
+    out = note_array(notes).copy()
+    out["pitch"] = np.clip(out["pitch"].astype(np.int16) + semitones, 0, 127)
+    return out
+
+
+def scale_velocities(notes, factor):
+    out = note_array(notes).copy()
+    out["velocity"] = np.clip(np.rint(out["velocity"] * factor), 1, 127)
+    return out
@@ -0,0 +1,129 @@
+# musictheory/pack.py
+# ============================
+# Single-file packed library container
+# ============================
+# A pack is a plain zip archive (stored, or deflated on request), so any zip
+# tool can list or extract it. PackReader memory-maps the file and indexes the
+# central directory once, so fetching a member by its library path is a dict
+# lookup plus a slice of the mapping — no extraction, no per-file opens.
+
+import mmap
+import struct
+import zipfile
+import zlib
+
+# Fixed timestamp keeps packs byte-identical between identical builds
+PACK_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")   # zip local file header (30 bytes)
+
+
+def pack_key(path):
+    """Library path -> pack key (forward slashes, no leading ./ or /)."""
+    key = path.replace("\\", "/")
+    while key.startswith("./"):
+        key = key[2:]
+    return key.lstrip("/")
+
+
+class PackWriter:
+    def __init__(self, path, compress=False):
+        self.path = path
+        self.compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        self.zip = zipfile.ZipFile(path, "w", compression=self.compression, allowZip64=True)
+        self.files = self.bytes = 0
+
+    def add(self, key, data):
+        info = zipfile.ZipInfo(pack_key(key), date_time=PACK_DATE_TIME)
+        info.compress_type = self.compression
+        self.zip.writestr(info, data)
+        self.files += 1
+        self.bytes += len(data)
+
+    def alias(self, key, target):
+        """Add `key` with the content of the already written member `target`."""
+        self.add(key, self.zip.read(pack_key(target)))
+
+    def close(self):
+        self.zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PackReader:
+    def __init__(self, path):
+        self.path = path
+        with zipfile.ZipFile(path) as zf:
+            infos = zf.infolist()
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        # key -> (local header offset, stored size, compression); the data
+        # offset is resolved from the local header on first access
+        self.index = {i.filename: (i.header_offset, i.compress_size, i.compress_type) for i in infos}
+        self._data_offsets = {}
+
+    def _locate(self, key):
+        offset = self._data_offsets.get(key)
+        if offset is None:
+            header_offset = self.index[key][0]
+            fields = LOCAL_HEADER.unpack_from(self._map, header_offset)
+            name_len, extra_len = fields[-2], fields[-1]
+            offset = header_offset + LOCAL_HEADER.size + name_len + extra_len
+            self._data_offsets[key] = offset
+        return offset
+
+    def view(self, key):
+        """Zero-copy memoryview of a stored member."""
+        _, size, compression = self.index[key]
+        if compression != zipfile.ZIP_STORED:
+            raise ValueError(f"{key} is compressed; use read()")
+        offset = self._locate(key)
+        return memoryview(self._map)[offset:offset + size]
+
+    def read(self, key):
+        _, size, compression = self.index[key]
+        offset = self._locate(key)
+        raw = self._map[offset:offset + size]
+        if compression == zipfile.ZIP_DEFLATED:
+            return zlib.decompress(raw, -15)
+        return bytes(raw)
+
+    def keys(self):
+        return self.index.keys()
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Inspect a packed MIDI library.")
+    parser.add_argument("pack")
+    parser.add_argument("key", nargs="?", help="Member to write to stdout (omit to list)")
+    args = parser.parse_args()
+
+    with PackReader(args.pack) as reader:
+        if args.key:
+            sys.stdout.buffer.write(reader.read(args.key))
+        else:
+            for key in reader.keys():
+                print(key)
@@ -0,0 +1,94 @@
+# musictheory/planner.py
+# ============================
+# Canonical job planner: generate each unique output once
+# ============================
+# Library scripts ask for identical content under several paths: mode files
+# repeat under every parent scale, and enharmonic roots (C#/Db) share a pitch.
+# Every work item is keyed by a digest of its content inputs; the first path
+# claimed for a digest is canonical and gets generated, later paths become
+# aliases. Once the canonical files exist the aliases are materialized as
+# hardlinks (falling back to relative symlinks, then copies), or as extra
+# members copied inside a pack, so the output tree looks exactly as before.
+
+import os
+import shutil
+
+from .pack import pack_key
+
+LINK_MODES = ("hardlink", "symlink", "copy")
+
+
+def canonical_roots(note_nums):
+    """Root name -> first root name with the same pitch (C# -> C#, Db -> C#)."""
+    first = {}
+    return {name: first.setdefault(pitch, name) for name, pitch in note_nums.items()}
+
+
+def link_file(target, path, mode="hardlink"):
+    """Make `path` show the content of `target`; returns the method that worked."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.lexists(path):
+        os.remove(path)
+    if mode == "hardlink":
+        try:
+            os.link(target, path)
+            return "hardlink"
+        except OSError:
+            mode = "symlink"
+    if mode == "symlink":
+        try:
+            os.symlink(os.path.relpath(target, os.path.dirname(path) or "."), path)
+            return "symlink"
+        except OSError:
+            pass
+    shutil.copyfile(target, path)
+    return "copy"
+
+
+class JobPlanner:
+    def __init__(self, link="hardlink", unit="notes"):
+        if link not in LINK_MODES:
+            raise ValueError(f"link must be one of {LINK_MODES}, got {link!r}")
+        self.link = link
+        self.unit = unit
+        self.canonical = {}     # digest -> canonical path
+        self.aliases = []       # (path, canonical path, digest)
+        self.work = self.saved = 0
+        self.methods = {}
+
+    def claim(self, digest, path, work=1):
+        """True if `path` should be generated; otherwise it is queued as an alias.
+
+        `work` is the item's size in the planner's unit (notes by default).
+        """
+        target = self.canonical.setdefault(digest, path)
+        if target == path:
+            self.work += work
+            return True
+        self.aliases.append((path, target, digest))
+        self.saved += work
+        return False
+
+    def materialize(self, manifest=None, pack=None, base_dir="."):
+        """Create every alias; call after the canonical outputs are written."""
+        for path, target, digest in self.aliases:
+            if manifest is not None and manifest.up_to_date(path, digest):
+                continue
+            if pack is not None:
+                pack.alias(pack_key(os.path.relpath(path, base_dir)),
+                           pack_key(os.path.relpath(target, base_dir)))
+                method = "pack"
+            else:
+                method = link_file(target, path, self.link)
+            self.methods[method] = self.methods.get(method, 0) + 1
+            if manifest is not None:
+                manifest.record(path, digest, [path])
+
+    def summary(self):
+        items = len(self.canonical) + len(self.aliases)
+        total = self.work + self.saved
+        share = self.saved / total if total else 0.0
+        methods = ", ".join(f"{n} {m}" for m, n in sorted(self.methods.items()))
+        return (f"{items} items planned, {len(self.canonical)} generated, {len(self.aliases)} aliased"
+                f" ({share:.0%} of work eliminated: {self.saved} of {total} {self.unit})"
+                + (f"; {methods}" if methods else ""))
@@ -0,0 +1,318 @@
+# musictheory/service.py
+# ============================
+# Local HTTP/JSON generation service: python -m musictheory.service
+# ============================
+# A small stdlib-only asyncio server. Requests become jobs on a bounded queue;
+# a fixed set of dispatcher tasks hands them to a process pool, so generation
+# never blocks the event loop. When the queue is full new jobs get 503 with
+# Retry-After instead of piling up (backpressure). Results are streamed back
+# with chunked transfer encoding.
+#
+#   GET  /health    queue depth, running jobs, capacity
+#   GET  /options   root notes and genres
+#   POST /song      {"root": "C", "genre": "jazz", "seed": 1, "length": 32, "format": "midi"|"wav"}
+#   POST /library   {"roots": [...], "genres": [...], "seed": 1, "length": 16, "wav": false}
+#                   -> zip of songs (same layout as a pack, see musictheory.pack)
+
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from .snapshot import load_snapshot
+
+THEORY = load_snapshot()
+NOTE_NUMS = THEORY["NOTE_NUMS"]
+GENRE_NAMES = {g.lower(): g for g in THEORY["GENRES"]}
+
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE = 32
+MAX_BODY = 64 * 1024
+MAX_LIBRARY_SONGS = 512
+MAX_LENGTH = 4096          # bars per song
+CHUNK = 64 * 1024
+RETRY_AFTER = 1            # seconds suggested to clients on 503
+
+# The pool starts workers lazily, after the server has accepted connections.
+# A worker forked from the server then holds copies of the open client
+# sockets, so writer.close() no longer ends the response. Workers therefore
+# start from a clean process instead of a fork of the server.
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+          413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================
+# JOBS (run in worker processes)
+# ============================
+def song_job(params):
+    from .arranger import song_bytes
+    midi, wav = song_bytes(NOTE_NUMS[params["root"]], params["genre"], seed=params["seed"],
+                           length=params["length"], wav=params["format"] == "wav")
+    return wav if params["format"] == "wav" else midi
+
+
+def library_job(params):
+    from .arranger import song_bytes
+    from .pack import PackWriter
+    from .planner import canonical_roots
+
+    # enharmonic roots (C#/Db) give identical songs: render once, copy the member
+    canon = canonical_roots({root: NOTE_NUMS[root] for root in params["roots"]})
+    buf = io.BytesIO()
+    with PackWriter(buf) as pack:
+        for root in params["roots"]:
+            for genre in params["genres"]:
+                key = f"{genre}/{root}_{genre}"
+                if canon[root] != root:
+                    target = f"{genre}/{canon[root]}_{genre}"
+                    pack.alias(key + ".mid", target + ".mid")
+                    if params["wav"]:
+                        pack.alias(key + ".wav", target + ".wav")
+                    continue
+                midi, wav = song_bytes(NOTE_NUMS[root], genre, seed=params["seed"],
+                                       length=params["length"], wav=params["wav"])
+                pack.add(key + ".mid", midi)
+                if wav is not None:
+                    pack.add(key + ".wav", wav)
+    return buf.getvalue()
+
+
+# ============================
+# REQUEST VALIDATION
+# ============================
+def parse_root(value):
+    root = str(value).strip()
+    root = root[:1].upper() + root[1:].lower()
+    if root not in NOTE_NUMS:
+        raise RequestError(400, f"unknown root {value!r}; choose from {', '.join(NOTE_NUMS)}")
+    return root
+
+
+def parse_genre(value):
+    genre = str(value).strip().lower()
+    if genre not in GENRE_NAMES:
+        raise RequestError(400, f"unknown genre {value!r}; choose from {', '.join(GENRE_NAMES.values())}")
+    return genre
+
+
+def is_int(value):
+    """JSON integers only: bool subclasses int, but true/false are not numbers."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def parse_common(body):
+    seed = body.get("seed")
+    if seed is None:
+        seed = random.randrange(2**32)
+    length = body.get("length")
+    if not is_int(seed) or (length is not None and not (is_int(length) and 0 < length <= MAX_LENGTH)):
+        raise RequestError(400, f"seed must be an int and length an int in 1..{MAX_LENGTH}")
+    return seed, length
+
+
+def song_params(body):
+    seed, length = parse_common(body)
+    fmt = body.get("format", "midi")
+    if fmt not in ("midi", "wav"):
+        raise RequestError(400, "format must be 'midi' or 'wav'")
+    return {"root": parse_root(body.get("root", "")), "genre": parse_genre(body.get("genre", "")),
+            "seed": seed, "length": length, "format": fmt}
+
+
+def library_params(body):
+    seed, length = parse_common(body)
+    roots = [parse_root(r) for r in body.get("roots") or list(NOTE_NUMS)]
+    genres = [parse_genre(g) for g in body.get("genres") or list(GENRE_NAMES)]
+    if len(roots) * len(genres) > MAX_LIBRARY_SONGS:
+        raise RequestError(400, f"at most {MAX_LIBRARY_SONGS} songs per library job")
+    return {"roots": roots, "genres": genres, "seed": seed, "length": length,
+            "wav": bool(body.get("wav", False))}
+
+
+# ============================
+# SERVER
+# ============================
+class GenerationService:
+    def __init__(self, workers=None, queue_size=DEFAULT_QUEUE):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                        mp_context=multiprocessing.get_context(WORKER_START_METHOD))
+        self.running = 0
+        self.completed = self.rejected = 0
+        self._dispatchers = []
+
+    async def start(self):
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+
+    async def close(self):
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self.pool.shutdown(cancel_futures=True)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            fn, params, future = await self.queue.get()
+            self.running += 1
+            try:
+                if not future.cancelled():
+                    future.set_result(await loop.run_in_executor(self.pool, fn, params))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self.running -= 1
+                self.queue.task_done()
+
+    def submit(self, fn, params):
+        """Queue a job; raises RequestError(503) when the queue is full."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((fn, params, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise RequestError(503, "job queue is full, retry later") from None
+        return future
+
+    def health(self):
+        return {"status": "ok", "workers": self.workers, "running": self.running,
+                "queued": self.queue.qsize(), "capacity": self.queue.maxsize,
+                "completed": self.completed, "rejected": self.rejected}
+
+    # ---- HTTP ----
+    async def handle(self, reader, writer):
+        try:
+            method, path, body = await read_request(reader)
+            await self.route(method, path, body, writer)
+        except RequestError as e:
+            headers = {"Retry-After": str(RETRY_AFTER)} if e.status == 503 else {}
+            await send_json(writer, e.status, {"error": str(e)}, headers)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            await send_json(writer, 500, {"error": f"{type(e).__name__}: {e}"})
+        finally:
+            writer.close()
+
+    async def route(self, method, path, body, writer):
+        if path == "/health" and method == "GET":
+            return await send_json(writer, 200, self.health())
+        if path == "/options" and method == "GET":
+            return await send_json(writer, 200, {"roots": list(NOTE_NUMS), "genres": list(GENRE_NAMES.values())})
+        if path == "/song" and method == "POST":
+            params = song_params(parse_json(body))
+            fn, mime, ext = song_job, ("audio/wav" if params["format"] == "wav" else "audio/midi"), \
+                ("wav" if params["format"] == "wav" else "mid")
+            name = f"{params['root']}_{params['genre']}_{params['seed']}.{ext}"
+        elif path == "/library" and method == "POST":
+            params = library_params(parse_json(body))
+            fn, mime, name = library_job, "application/zip", f"library_{params['seed']}.zip"
+        elif path in ("/health", "/options", "/song", "/library"):
+            raise RequestError(405, f"{method} not allowed on {path}")
+        else:
+            raise RequestError(404, f"no route for {path}")
+
+        data = await self.submit(fn, params)
+        self.completed += 1
+        await send_stream(writer, data, mime, {"Content-Disposition": f'attachment; filename="{name}"',
+                                               "X-Seed": str(params["seed"])})
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT):
+        await self.start()
+        server = await asyncio.start_server(self.handle, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+
+async def read_request(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise RequestError(400, "malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            k, v = line.split(":", 1)
+            headers[k.strip().lower()] = v.strip()
+    length = int(headers.get("content-length", 0) or 0)
+    if length > MAX_BODY:
+        raise RequestError(413, f"request body over {MAX_BODY} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], body
+
+
+def parse_json(body):
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        raise RequestError(400, "body must be JSON") from None
+    if not isinstance(data, dict):
+        raise RequestError(400, "body must be a JSON object")
+    return data
+
+
+def response_head(status, headers):
+    lines = [f"HTTP/1.1 {status} {STATUS.get(status, '')}", "Connection: close"]
+    lines += [f"{k}: {v}" for k, v in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin1")
+
+
+async def send_json(writer, status, payload, headers=None):
+    data = json.dumps(payload).encode()
+    writer.write(response_head(status, {"Content-Type": "application/json",
+                                        "Content-Length": len(data), **(headers or {})}))
+    writer.write(data)
+    await writer.drain()
+
+
+async def send_stream(writer, data, mime, headers):
+    """Chunked response, draining between chunks so slow clients apply backpressure."""
+    writer.write(response_head(200, {"Content-Type": mime, "Transfer-Encoding": "chunked", **headers}))
+    view = memoryview(data)
+    for i in range(0, len(view), CHUNK):
+        chunk = view[i:i + CHUNK]
+        writer.write(b"%x\r\n" % len(chunk) + chunk + b"\r\n")
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve song/library generation over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = all cores)")
+    parser.add_argument("--queue", type=int, default=DEFAULT_QUEUE,
+                        help=f"Jobs allowed to wait before requests get 503 (default: {DEFAULT_QUEUE})")
+    args = parser.parse_args()
+
+    async def main():
+        service = GenerationService(args.workers or None, args.queue)
+        print(f"🎛  Serving on http://{args.host}:{args.port} "
+              f"({service.workers} workers, queue {args.queue})")
+        await service.serve(args.host, args.port)
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,164 @@
+# musictheory/sink.py
+# ============================
+# Output sinks: where encoded files go
+# ============================
+# Generators hand a sink (path, bytes) and carry on. FileSink writes inline;
+# ThreadedFileSink puts writes on a bounded queue drained by writer threads,
+# so encoding overlaps makedirs/open/write (the slow part on network storage).
+# A full queue blocks the producer and the time spent blocked is reported as
+# queue stall. Both create each directory once; plan() creates the whole tree
+# up front from the list of output paths. PackSink sends the same writes into a
+# single zip container. Sinks are per process: pool workers must use a plain
+# FileSink (a forked copy of a threaded sink has no threads).
+
+import os
+import queue
+import threading
+import time
+
+
+class FileSink:
+    def __init__(self):
+        self.dirs = set()
+        self.lock = threading.Lock()
+        self.files = self.bytes = 0
+        self.write_seconds = self.stall_seconds = 0.0
+        self.started = time.perf_counter()
+
+    def plan(self, paths):
+        """Create every directory the given output paths need, once."""
+        for directory in sorted({os.path.dirname(p) for p in paths}):
+            self._ensure(directory)
+
+    def _ensure(self, directory):
+        if directory and directory not in self.dirs:
+            os.makedirs(directory, exist_ok=True)
+            self.dirs.add(directory)
+
+    def write(self, path, data):
+        self._write(path, data)
+
+    def _write(self, path, data):
+        start = time.perf_counter()
+        self._store(path, data)
+        with self.lock:
+            self.write_seconds += time.perf_counter() - start
+            self.files += 1
+            self.bytes += len(data)
+
+    def _store(self, path, data):
+        self._ensure(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def flush(self):
+        """Wait for pending writes; returns stats()."""
+        return self.stats()
+
+    def close(self):
+        return self.flush()
+
+    def stats(self):
+        wall = time.perf_counter() - self.started
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "wall_seconds": wall,
+            "write_seconds": self.write_seconds,
+            "stall_seconds": self.stall_seconds,
+            "files_per_sec": self.files / wall if wall else 0.0,
+            "mb_per_sec": self.bytes / 1e6 / wall if wall else 0.0,
+        }
+
+    def report(self):
+        s = self.stats()
+        return (f"{s['files']} files, {s['bytes'] / 1e6:.1f} MB in {s['wall_seconds']:.2f}s "
+                f"({s['files_per_sec']:.0f} files/s, {s['mb_per_sec']:.1f} MB/s); "
+                f"writing {s['write_seconds']:.2f}s, queue stalls {s['stall_seconds']:.2f}s")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ThreadedFileSink(FileSink):
+    def __init__(self, threads=4, queue_size=256):
+        super().__init__()
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.threads = [threading.Thread(target=self._drain, daemon=True) for _ in range(threads)]
+        for t in self.threads:
+            t.start()
+
+    def write(self, path, data):
+        self._raise()
+        if not self.threads:
+            raise ValueError("write to a closed sink")
+        try:
+            self.queue.put_nowait((path, data))
+        except queue.Full:
+            start = time.perf_counter()
+            self.queue.put((path, data))
+            self.stall_seconds += time.perf_counter() - start
+
+    def _drain(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                if self.error is None:
+                    self._write(*item)
+            except BaseException as e:
+                self.error = self.error or e
+            finally:
+                self.queue.task_done()
+
+    def _raise(self):
+        if self.error is not None:
+            raise self.error
+
+    def flush(self):
+        self.queue.join()
+        self._raise()
+        return self.stats()
+
+    def close(self):
+        self.queue.join()
+        for _ in self.threads:
+            self.queue.put(None)
+        for t in self.threads:
+            t.join()
+        self.threads = []
+        self._raise()
+        return self.stats()
+
+
+class PackSink(FileSink):
+    """Adds files to a musictheory.pack.PackWriter instead of the filesystem.
+
+    Members are keyed by their path relative to `base_dir`. Inline only: a zip
+    archive takes one member at a time.
+    """
+
+    def __init__(self, pack, base_dir="."):
+        super().__init__()
+        self.pack = pack
+        self.base_dir = base_dir
+
+    def plan(self, paths):
+        pass
+
+    def _store(self, path, data):
+        self.pack.add(os.path.relpath(path, self.base_dir), data)
+
+    def close(self):
+        self.pack.close()
+        return self.stats()
+
+
+def make_sink(writers=0, queue_size=256):
+    """FileSink for writers=0, else a ThreadedFileSink with that many threads."""
+    return ThreadedFileSink(writers, queue_size) if writers > 0 else FileSink()
@@ -0,0 +1,240 @@
+# musictheory/smf.py
+# ============================
+# Native Standard MIDI File encoder
+# ============================
+# Encodes (pitch, start, end, vel) note tuples straight into SMF track chunks
+# without building a pretty_midi/mido object graph. Timing, channel
+# assignment, event ordering and running status follow pretty_midi's writer,
+# so both backends produce byte-identical files for the same track data.
+
+import heapq
+import os
+import struct
+
+DEFAULT_RESOLUTION = 220   # pretty_midi.PrettyMIDI() defaults
+DEFAULT_TEMPO = 120.0
+
+# Channels for melodic tracks, assigned round-robin by track index (9 = drums)
+MELODIC_CHANNELS = [c for c in range(16) if c != 9]
+DRUM_CHANNEL = 9
+
+END_OF_TRACK = b"\x01\xff\x2f\x00"   # delta 1, as pretty_midi writes it
+
+
+def varlen(value):
+    """Encode a non-negative int as a MIDI variable-length quantity."""
+    out = bytearray([value & 0x7F])
+    value >>= 7
+    while value:
+        out.insert(0, 0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(out)
+
+
+def iter_note_rows(notes):
+    """Return (pitch, start, end, vel) rows from tuples or an array of them."""
+    if hasattr(notes, "tolist"):
+        notes = notes.tolist()
+    return notes
+
+
+def tempo_events(resolution=DEFAULT_RESOLUTION, tempo=DEFAULT_TEMPO):
+    """set_tempo + default 4/4 time signature at tick 0."""
+    tick_scale = 60.0 / (tempo * resolution)
+    usec = int(6e7 / (60. / (tick_scale * resolution)))
+    return (b"\x00\xff\x51\x03" + usec.to_bytes(3, "big")
+            + b"\x00\xff\x58\x04\x04\x02\x18\x08")
+
+
+def tempo_track(resolution=DEFAULT_RESOLUTION, tempo=DEFAULT_TEMPO):
+    """Track 0: tempo events + end of track."""
+    data = tempo_events(resolution, tempo) + END_OF_TRACK
+    return b"MTrk" + struct.pack(">I", len(data)) + data
+
+
+def encode_track(name, notes, channel, program=0, tick_scale=60.0 / (DEFAULT_TEMPO * DEFAULT_RESOLUTION)):
+    """Encode one instrument as an MTrk chunk."""
+    data = bytearray()
+    if name:
+        raw = name.encode("latin1")
+        data += b"\x00\xff\x03" + varlen(len(raw)) + raw
+    data += bytes((0, 0xC0 | channel, program))
+
+    # note_on / note_on(vel 0) pairs sorted by (tick, pitch, velocity) like
+    # pretty_midi, which puts a note-off ahead of a same-tick re-strike
+    events = []
+    for pitch, start, end, vel in iter_note_rows(notes):
+        pitch, vel = int(pitch), int(vel)
+        if not (0 <= pitch < 128 and 0 <= vel < 128):
+            raise ValueError(f"note out of MIDI range: pitch={pitch}, velocity={vel}")
+        on = int(round(start / tick_scale)) if start > 0 else 0
+        off = int(round(end / tick_scale)) if end > 0 else 0
+        events.append((on, (pitch << 8) | vel))
+        events.append((off, pitch << 8))
+    events.sort()
+
+    last = 0
+    status = 0x90 | channel
+    for i, (tick, key) in enumerate(events):
+        data += varlen(tick - last)
+        if i == 0:
+            data.append(status)   # running status for every later note
+        data.append(key >> 8)
+        data.append(key & 0xFF)
+        last = tick
+    data += END_OF_TRACK
+    return b"MTrk" + struct.pack(">I", len(data)) + bytes(data)
+
+
+def encode_smf(track_data, resolution=DEFAULT_RESOLUTION, tempo=DEFAULT_TEMPO):
+    """track_data = [(name, notes, is_drum[, program]), ...] -> SMF type 1 bytes"""
+    tick_scale = 60.0 / (tempo * resolution)
+    chunks = [tempo_track(resolution, tempo)]
+    for n, track in enumerate(track_data):
+        name, notes, is_drum = track[:3]
+        program = track[3] if len(track) > 3 else 0
+        channel = DRUM_CHANNEL if is_drum else MELODIC_CHANNELS[n % len(MELODIC_CHANNELS)]
+        chunks.append(encode_track(name, notes, channel, program, tick_scale))
+    header = b"MThd" + struct.pack(">IHHH", 6, 1, len(chunks), resolution)
+    return header + b"".join(chunks)
+
+
+# Two events per note, each 2 data bytes plus a 1-2 byte delta (running status)
+EST_BYTES_PER_NOTE = 6.5
+
+
+def estimate_size(track_data):
+    """Approximate encoded size without encoding: exact chunk framing plus
+    EST_BYTES_PER_NOTE per note (within a few percent on library files)."""
+    size = 14 + len(tempo_track())
+    for track in track_data:
+        name, notes = track[0], track[1]
+        size += 8 + 3 + 1 + len(END_OF_TRACK)   # chunk header, program change, first status
+        if name:
+            raw = len(name.encode("latin1"))
+            size += 3 + len(varlen(raw)) + raw
+        size += EST_BYTES_PER_NOTE * len(notes)
+    return int(size)
+
+
+def write_smf(track_data, filename, **kwargs):
+    data = encode_smf(track_data, **kwargs)
+    with open(filename, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+class SMFStreamWriter:
+    """Type 0 SMF written incrementally to a seekable binary file.
+
+    Notes are queued in a heap of pending events; flush(tick) encodes every
+    event before `tick` straight to the file, so memory holds only events that
+    are still ahead of the caller's horizon. close() writes the end of track
+    and patches the chunk length in the header.
+    """
+
+    def __init__(self, f, programs, resolution=DEFAULT_RESOLUTION, tempo=DEFAULT_TEMPO, name=None):
+        """programs = {channel: program} for every channel that will be used"""
+        self.f = f
+        self.tick_scale = 60.0 / (tempo * resolution)
+        self.pending = []
+        self.last_tick = 0
+        self.status = None
+        self.notes = 0
+        f.write(b"MThd" + struct.pack(">IHHH", 6, 0, 1, resolution))
+        self._length_pos = f.tell() + 4
+        data = bytearray(tempo_events(resolution, tempo))
+        if name:
+            raw = name.encode("latin1")
+            data += b"\x00\xff\x03" + varlen(len(raw)) + raw
+        for channel, program in sorted(programs.items()):
+            data += bytes((0, 0xC0 | channel, program))
+        f.write(b"MTrk\x00\x00\x00\x00" + data)
+        self.length = len(data)
+
+    def tick(self, time):
+        return int(round(time / self.tick_scale)) if time > 0 else 0
+
+    def add(self, notes, channel):
+        # (tick, is_on, channel, pitch, vel): note-offs sort ahead of same-tick note-ons
+        for pitch, start, end, vel in iter_note_rows(notes):
+            pitch, vel = int(pitch), int(vel)
+            if not (0 <= pitch < 128 and 0 <= vel < 128):
+                raise ValueError(f"note out of MIDI range: pitch={pitch}, velocity={vel}")
+            heapq.heappush(self.pending, (self.tick(start), 1, channel, pitch, vel))
+            heapq.heappush(self.pending, (self.tick(end), 0, channel, pitch, 0))
+            self.notes += 1
+
+    def flush(self, until_tick=None):
+        """Encode queued events earlier than until_tick (all of them if None)."""
+        out = bytearray()
+        pending = self.pending
+        while pending and (until_tick is None or pending[0][0] < until_tick):
+            tick, _, channel, pitch, vel = heapq.heappop(pending)
+            if tick < self.last_tick:
+                raise ValueError("event added behind an already flushed tick")
+            out += varlen(tick - self.last_tick)
+            status = 0x90 | channel
+            if status != self.status:
+                out.append(status)
+                self.status = status
+            out.append(pitch)
+            out.append(vel)
+            self.last_tick = tick
+        self.f.write(out)
+        self.length += len(out)
+
+    def close(self):
+        self.flush()
+        self.f.write(END_OF_TRACK)
+        self.length += len(END_OF_TRACK)
+        self.f.seek(self._length_pos)
+        self.f.write(struct.pack(">I", self.length))
+        self.f.seek(0, os.SEEK_END)
+
+
+# ============================
+# BENCHMARK: python -m musictheory.smf
+# ============================
+def benchmark(files=300, tracks=4, notes_per_track=64, seed=0):
+    """Files/sec of create_named_midi for each backend on the same track data."""
+    import random
+    import tempfile
+    import time
+    from .utils import create_named_midi
+
+    rng = random.Random(seed)
+    songs = []
+    for _ in range(files):
+        song = []
+        for t in range(tracks):
+            notes = []
+            for i in range(notes_per_track):
+                start = i * 0.5
+                notes.append((rng.randint(36, 96), start, start + 0.5, rng.randint(60, 110)))
+            song.append((f"track_{t}", notes, t == tracks - 1))
+        songs.append(song)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("pretty_midi", "smf"):
+            start = time.perf_counter()
+            for i, song in enumerate(songs):
+                create_named_midi(song, os.path.join(tmp, backend, f"{i}.mid"), backend=backend)
+            elapsed = time.perf_counter() - start
+            results[backend] = files / elapsed
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare MIDI writer backends.")
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--notes", type=int, default=64, help="Notes per track")
+    args = parser.parse_args()
+
+    rates = benchmark(files=args.files, notes_per_track=args.notes)
+    for backend, rate in rates.items():
+        print(f"{backend:<12}{rate:>10.1f} files/sec")
+    print(f"speedup     {rates['smf'] / rates['pretty_midi']:>10.1f}x")
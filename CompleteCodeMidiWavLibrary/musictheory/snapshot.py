@@ -0,0 +1,63 @@
+# musictheory/snapshot.py
+# ============================
+# Frozen theory snapshot for fast startup
+# ============================
+# The CLI only needs note and genre names to list options and validate
+# arguments. Importing config.py (and the arranger behind it) costs far more
+# than the answer, so those names are frozen into theory_snapshot.json next to
+# this file. The snapshot records the sha1 of config.py; if config changes the
+# snapshot is rebuilt from config on first use, so it can never go stale.
+# Regenerate explicitly with: python -m musictheory.snapshot
+
+import hashlib
+import json
+import os
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(HERE, "config.py")
+SNAPSHOT_PATH = os.path.join(HERE, "theory_snapshot.json")
+
+
+def config_digest():
+    with open(CONFIG_PATH, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def build_snapshot():
+    from . import config
+    return {
+        "config_sha1": config_digest(),
+        "NOTE_NUMS": config.NOTE_NUMS,
+        "GENRES": config.GENRES,
+        "SONG_STRUCTURES": config.SONG_STRUCTURES,
+    }
+
+
+def write_snapshot(data, path=SNAPSHOT_PATH):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=1)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """Snapshot dict; rebuilt (and re-saved when possible) if missing or stale."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("config_sha1") == config_digest():
+            return data
+    except (OSError, ValueError):
+        pass
+    data = build_snapshot()
+    try:
+        write_snapshot(data, path)
+    except OSError:
+        pass    # read-only install: use the fresh data without caching it
+    return data
+
+
+if __name__ == "__main__":
+    write_snapshot(build_snapshot())
+    print(f"🧊 Theory snapshot written to {SNAPSHOT_PATH}")
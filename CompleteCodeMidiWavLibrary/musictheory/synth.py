@@ -0,0 +1,552 @@
+# musictheory/synth.py
+# ============================
+# Offline NumPy synthesizer: note tracks -> WAV
+# ============================
+# Renders the same track_data that create_named_midi writes (name, notes,
+# is_drum) to audio without a SoundFont: each note is one vectorized
+# oscillator + ADSR envelope, each drum hit a short tone/noise one-shot, all
+# summed into a float32 mix and written as 16-bit PCM with the stdlib wave
+# module. Note times are seconds, as in the MIDI files.
+#
+# WavStreamWriter renders in fixed blocks: notes wait in a heap ordered by
+# start frame and only voices sounding in the current block are synthesized,
+# so memory depends on polyphony, not on song length.
+#
+# render_wav_parallel spreads whole tracks over worker processes instead: each
+# worker adds its tracks into a multiprocessing.shared_memory buffer and the
+# parent mixes those buffers in place, so no audio is pickled between processes.
+#
+# Songs repeat the same few drum hits and pitch/length pairs over and over, so
+# finished notes are kept in a ToneCache keyed by (voice, pitch, velocity
+# bucket, length bucket). render_track groups a track's notes by cache entry
+# and overlap-adds each entry at all of its offsets in one vectorized pass.
+
+import heapq
+import os
+import wave
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from .config import DRUMS
+from .instrument import count, timer
+from .notes import note_array
+
+SAMPLE_RATE = 44100
+MASTER_GAIN = 0.35   # headroom for a handful of overlapping voices before soft clipping
+BLOCK_FRAMES = 4096
+
+# Tone cache: velocities and note lengths are quantized so repeats share an
+# entry; longer notes are synthesized directly (per block when streaming)
+VELOCITY_STEP = 8          # 16 velocity buckets
+LENGTH_STEP = 0.01         # seconds
+MAX_CACHED_SECONDS = 4.0
+TONE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def osc_sine(phase):
+    return np.sin(2*np.pi*phase)
+
+def osc_triangle(phase):
+    return 4*np.abs(phase - 0.5) - 1
+
+def osc_saw(phase):
+    return 2*phase - 1
+
+def osc_square(phase):
+    return np.where(phase < 0.5, 1.0, -1.0)
+
+def osc_organ(phase):
+    # fundamental plus two soft harmonics, a mellow keyboard-ish tone
+    return np.sin(2*np.pi*phase) + 0.4*np.sin(4*np.pi*phase) + 0.15*np.sin(6*np.pi*phase)
+
+WAVEFORMS = {
+    "sine": osc_sine, "triangle": osc_triangle, "saw": osc_saw,
+    "square": osc_square, "organ": osc_organ,
+}
+
+# Melodic voices by track role; times in seconds, sustain as a level 0..1
+VOICES = {
+    "piano":  {"wave": "organ",    "attack": 0.005, "decay": 0.40, "sustain": 0.35, "release": 0.20, "gain": 0.45},
+    "bass":   {"wave": "triangle", "attack": 0.008, "decay": 0.20, "sustain": 0.70, "release": 0.08, "gain": 0.80},
+    "melody": {"wave": "square",   "attack": 0.010, "decay": 0.10, "sustain": 0.60, "release": 0.10, "gain": 0.22},
+    "lead":   {"wave": "saw",      "attack": 0.010, "decay": 0.15, "sustain": 0.60, "release": 0.12, "gain": 0.22},
+    "pad":    {"wave": "sine",     "attack": 0.200, "decay": 0.30, "sustain": 0.80, "release": 0.60, "gain": 0.35},
+}
+DEFAULT_VOICE = "piano"
+
+# Drum one-shots by DRUMS name: pitched tone sweeping freq[0] -> freq[1],
+# plus noise (bright = high-passed); both decay exponentially over `decay` s
+DRUM_SOUNDS = {
+    "kick":       {"freq": (150, 45),  "tone": 1.0, "noise": 0.00, "bright": False, "decay": 0.30},
+    "snare":      {"freq": (200, 180), "tone": 0.4, "noise": 0.70, "bright": False, "decay": 0.15},
+    "clap":       {"freq": (0, 0),     "tone": 0.0, "noise": 0.80, "bright": False, "decay": 0.12},
+    "rim":        {"freq": (1700, 1700), "tone": 0.5, "noise": 0.30, "bright": True, "decay": 0.03},
+    "closed_hat": {"freq": (0, 0),     "tone": 0.0, "noise": 0.50, "bright": True,  "decay": 0.04},
+    "open_hat":   {"freq": (0, 0),     "tone": 0.0, "noise": 0.50, "bright": True,  "decay": 0.25},
+    "ride":       {"freq": (5200, 5200), "tone": 0.1, "noise": 0.35, "bright": True, "decay": 0.45},
+    "crash":      {"freq": (0, 0),     "tone": 0.0, "noise": 0.60, "bright": True,  "decay": 0.90},
+    "tom_low":    {"freq": (110, 80),  "tone": 0.9, "noise": 0.10, "bright": False, "decay": 0.30},
+    "tom_mid":    {"freq": (160, 120), "tone": 0.9, "noise": 0.10, "bright": False, "decay": 0.25},
+    "tom_high":   {"freq": (220, 170), "tone": 0.9, "noise": 0.10, "bright": False, "decay": 0.20},
+    "cowbell":    {"freq": (560, 560), "tone": 0.7, "noise": 0.00, "bright": False, "decay": 0.15},
+    "conga":      {"freq": (330, 300), "tone": 0.8, "noise": 0.05, "bright": False, "decay": 0.18},
+    "bongo":      {"freq": (420, 400), "tone": 0.8, "noise": 0.05, "bright": False, "decay": 0.12},
+}
+DRUM_NAMES = {pitch: name for name, pitch in DRUMS.items()}
+DRUM_GAIN = 0.7
+
+
+def midi_to_hz(pitch):
+    return 440.0 * 2.0 ** ((np.asarray(pitch, dtype=np.float64) - 69) / 12)
+
+
+def voice_key(name, is_drum=False):
+    """VOICES key for a track, picked by role keyword in its name ("verse_bass")."""
+    if is_drum:
+        return None
+    lowered = name.lower()
+    for role in VOICES:
+        if role in lowered:
+            return role
+    return DEFAULT_VOICE
+
+
+def voice_for(name, is_drum=False):
+    role = voice_key(name, is_drum)
+    return None if role is None else VOICES[role]
+
+
+def adsr(t, held, voice):
+    """Envelope at times t (s since note on) for a note held `held` seconds."""
+    attack, decay, sustain = voice["attack"], voice["decay"], voice["sustain"]
+    points, levels = [0.0, attack, attack + decay], [0.0, 1.0, sustain]
+    env = np.interp(t, points, levels)
+    end_level = np.interp(held, points, levels)
+    released = t >= held
+    env[released] = end_level * np.maximum(0.0, 1 - (t[released] - held) / voice["release"])
+    return env
+
+
+def tone_frames(held, voice, sample_rate=SAMPLE_RATE):
+    return int((held + voice["release"]) * sample_rate)
+
+
+def tone_segment(pitch, held, voice, offset, count, sample_rate=SAMPLE_RATE):
+    """Frames [offset, offset+count) of a melodic note (oscillator x ADSR)."""
+    t = (offset + np.arange(count)) / sample_rate
+    phase = (midi_to_hz(pitch) * t) % 1.0
+    return WAVEFORMS[voice["wave"]](phase) * adsr(t, held, voice)
+
+
+def tone(pitch, held, voice, sample_rate=SAMPLE_RATE):
+    """One melodic note, including its release tail."""
+    return tone_segment(pitch, held, voice, 0, tone_frames(held, voice, sample_rate), sample_rate)
+
+
+def drum_sound(pitch):
+    """DRUM_SOUNDS entry for a GM drum pitch (unknown pitches fall back to a rim click)."""
+    return DRUM_SOUNDS.get(DRUM_NAMES.get(pitch), DRUM_SOUNDS["rim"])
+
+
+def drum_frames(pitch, sample_rate=SAMPLE_RATE):
+    return int(drum_sound(pitch)["decay"] * 5 * sample_rate)
+
+
+def drum_hit(pitch, sample_rate=SAMPLE_RATE):
+    """One-shot for a GM drum pitch, decayed to silence."""
+    sound = drum_sound(pitch)
+    decay = sound["decay"]
+    t = np.arange(drum_frames(pitch, sample_rate)) / sample_rate
+    env = np.exp(-t / decay)
+    out = np.zeros_like(t)
+    if sound["tone"]:
+        f0, f1 = sound["freq"]
+        # exponential sweep; phase is the integral of the instantaneous frequency
+        k = np.log(f1 / f0) / decay if f1 != f0 else 0.0
+        phase = f0 * t if k == 0 else f0 * np.expm1(k * np.minimum(t, decay)) / k + f1 * np.maximum(t - decay, 0)
+        out += sound["tone"] * np.sin(2*np.pi*phase)
+    if sound["noise"]:
+        noise = np.random.default_rng(pitch).uniform(-1, 1, len(t))
+        if sound["bright"]:
+            noise = np.diff(noise, prepend=0.0) * 0.5
+        out += sound["noise"] * noise
+    return out * env
+
+
+def note_sound(is_drum, pitch, held, vel, role, sample_rate=SAMPLE_RATE):
+    """A whole note (drum hit, or tone with its release) at its final gain."""
+    if is_drum:
+        data = drum_hit(pitch, sample_rate) * DRUM_GAIN
+    else:
+        voice = VOICES[role]
+        data = tone(pitch, held, voice, sample_rate) * voice["gain"]
+    return (data * (vel / 127)).astype(np.float32)
+
+
+class ToneCache:
+    """Bounded LRU of rendered notes keyed by (voice, pitch, velocity bucket,
+    length bucket, sample rate). Entries are read-only float32 arrays; the
+    least recently used ones are dropped once max_bytes is exceeded."""
+
+    def __init__(self, max_bytes=TONE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def cacheable(is_drum, held):
+        return is_drum or held <= MAX_CACHED_SECONDS
+
+    @staticmethod
+    def quantize(held, vel):
+        """Bucket centre velocity and rounded length a cached note is rendered with."""
+        vel = min((int(vel) // VELOCITY_STEP + 0.5) * VELOCITY_STEP, 127)
+        return round(held / LENGTH_STEP) * LENGTH_STEP, vel
+
+    def sound(self, is_drum, pitch, held, vel, role, sample_rate=SAMPLE_RATE):
+        held, vel = self.quantize(0.0 if is_drum else held, vel)
+        key = (role, pitch, vel, held, sample_rate)
+        data = self.entries.get(key)
+        if data is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return data
+        self.misses += 1
+        data = note_sound(is_drum, pitch, held, vel, role, sample_rate)
+        data.flags.writeable = False
+        if data.nbytes <= self.max_bytes:
+            self.entries[key] = data
+            self.bytes += data.nbytes
+            while self.bytes > self.max_bytes:
+                _, old = self.entries.popitem(last=False)
+                self.bytes -= old.nbytes
+                self.evictions += 1
+        return data
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self.entries), "bytes": self.bytes,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = self.hits = self.misses = self.evictions = 0
+
+
+TONE_CACHE = ToneCache()
+
+
+def add_at(out, sound, offset):
+    """Add one copy of `sound` into `out` at `offset`, clipped to its end."""
+    data = sound[:max(len(out) - offset, 0)]
+    out[offset:offset + len(data)] += data
+
+
+def overlap_add(out, sound, offsets):
+    """Add `sound` into `out` at every start frame in `offsets`; overlapping
+    copies accumulate and samples past the end of `out` are dropped.
+
+    The copies are added as rows of a strided window view of `out`, split into
+    layers in which no two copies overlap (copy i of the sorted offsets goes to
+    layer i % depth, depth being the most copies sounding at once), so each
+    layer is a single fancy-indexed add of whole rows.
+    """
+    offsets = np.sort(np.asarray(offsets, dtype=np.int64))
+    size = len(sound)
+    fits = int(np.searchsorted(offsets, len(out) - size, side="right"))
+    for offset in offsets[fits:].tolist():   # copies cut short by the end of `out`
+        add_at(out, sound, offset)
+    offsets = offsets[:fits]
+    if not len(offsets) or not size:
+        return
+    rows = as_strided(out, shape=(len(out) - size + 1, size), strides=out.strides * 2)
+    depth = int((np.arange(len(offsets)) - np.searchsorted(offsets, offsets - size + 1)).max()) + 1
+    for layer in range(depth):
+        rows[offsets[layer::depth]] += sound
+
+
+def render_track(notes, is_drum=False, name="", sample_rate=SAMPLE_RATE, frames=None, out=None,
+                 cache=TONE_CACHE):
+    """Mono float32 buffer for one track; `frames` fixes the length (else fits
+    the notes). Pass `out` to add into an existing buffer instead, and
+    cache=None to synthesize every note exactly instead of from the tone cache.
+
+    Notes served by the same cache entry share one array, so each entry is
+    placed at all of its start frames in one overlap_add.
+    """
+    notes = note_array(notes)
+    role = voice_key(name, is_drum)
+    placements = {}   # id(sound) -> (sound, start frames)
+    for pitch, start, end, vel in notes.tolist():
+        held = max(end - start, 0.0)
+        if cache is not None and cache.cacheable(is_drum, held):
+            data = cache.sound(is_drum, pitch, held, vel, role, sample_rate)
+        else:
+            data = note_sound(is_drum, pitch, held, vel, role, sample_rate)
+        placements.setdefault(id(data), (data, []))[1].append(int(round(start * sample_rate)))
+    if out is not None:
+        frames = len(out)
+    elif frames is None:
+        frames = max((max(offsets) + len(data) for data, offsets in placements.values()), default=0)
+    if out is None:
+        out = np.zeros(frames, dtype=np.float32)
+    for data, offsets in placements.values():
+        overlap_add(out, data, offsets)
+    return out
+
+
+def song_frames(track_data, sample_rate=SAMPLE_RATE):
+    """Frames up to the last sounding sample of any note, tails included."""
+    last = 0
+    for name, notes, is_drum in track_data:
+        notes = note_array(notes)
+        if not len(notes):
+            continue
+        starts = np.rint(notes["start"] * sample_rate).astype(np.int64)
+        if is_drum:
+            tails = np.array([drum_frames(p, sample_rate) for p in notes["pitch"].tolist()])
+        else:
+            held = np.maximum(notes["end"] - notes["start"], 0.0)
+            tails = ((held + voice_for(name)["release"]) * sample_rate).astype(np.int64)
+        last = max(last, int((starts + tails).max()))
+    return last
+
+
+def mix_tracks(track_data, sample_rate=SAMPLE_RATE):
+    """Sum every track into one float32 buffer, then apply master gain and soft clip."""
+    frames = song_frames(track_data, sample_rate)
+    mix = np.zeros(frames, dtype=np.float32)
+    for name, notes, is_drum in track_data:
+        mix += render_track(notes, is_drum, name, sample_rate, frames)
+    return master(mix)
+
+
+def master(mix):
+    return np.tanh(mix * MASTER_GAIN).astype(np.float32)
+
+
+def to_pcm16(samples):
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+
+
+def write_wav(samples, filename, sample_rate=SAMPLE_RATE):
+    with wave.open(filename, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(to_pcm16(samples).tobytes())
+
+
+class WavStreamWriter:
+    """Block-based mono 16-bit WAV renderer with bounded memory.
+
+    add() queues notes (any order); render(until) synthesizes and writes every
+    whole block ending by frame `until`; close() plays out remaining notes and
+    tails. Drum hits and notes up to MAX_CACHED_SECONDS come from the tone
+    cache; longer notes (or all of them with cache=None) are computed per block
+    from their absolute offset.
+    """
+
+    def __init__(self, filename, sample_rate=SAMPLE_RATE, block=BLOCK_FRAMES, cache=TONE_CACHE):
+        self.sample_rate = sample_rate
+        self.block = block
+        self.cache = cache
+        self.wav = wave.open(filename, "wb")
+        self.wav.setnchannels(1)
+        self.wav.setsampwidth(2)
+        self.wav.setframerate(sample_rate)
+        self.pending = []    # heap of (start_frame, seq, is_drum, pitch, held, vel, role)
+        self.active = []     # [start_frame, end_frame, render(offset, count)]
+        self.frame = 0       # first frame of the next block
+        self.notes = 0
+        self._seq = 0
+
+    def add(self, notes, is_drum=False, name=""):
+        role = voice_key(name, is_drum)
+        for pitch, start, end, vel in note_array(notes).tolist():
+            start_frame = int(round(start * self.sample_rate))
+            if start_frame < self.frame:
+                raise ValueError("note added behind an already rendered block")
+            held = max(end - start, 0.0)
+            if self.cache is not None and self.cache.cacheable(is_drum, held):
+                held, vel = self.cache.quantize(held, vel)
+            heapq.heappush(self.pending, (start_frame, self._seq, is_drum, pitch, held, vel, role))
+            self._seq += 1
+            self.notes += 1
+
+    def _start_voice(self, start_frame, is_drum, pitch, held, vel, role):
+        sr = self.sample_rate
+        if self.cache is not None and self.cache.cacheable(is_drum, held):
+            data = self.cache.sound(is_drum, pitch, held, vel, role, sr)
+        elif is_drum:
+            data = note_sound(is_drum, pitch, held, vel, role, sr)
+        else:
+            voice = VOICES[role]
+            gain = voice["gain"] * vel / 127
+            render = lambda offset, count: tone_segment(pitch, held, voice, offset, count, sr) * gain
+            self.active.append([start_frame, start_frame + tone_frames(held, voice, sr), render])
+            return
+        render = lambda offset, count: data[offset:offset + count]
+        self.active.append([start_frame, start_frame + len(data), render])
+
+    def _render_block(self, frames):
+        start, end = self.frame, self.frame + frames
+        pending = self.pending
+        while pending and pending[0][0] < end:
+            start_frame, _, is_drum, pitch, held, vel, role = heapq.heappop(pending)
+            self._start_voice(start_frame, is_drum, pitch, held, vel, role)
+        mix = np.zeros(frames, dtype=np.float32)
+        still_active = []
+        for entry in self.active:
+            note_start, note_end, render = entry
+            a, b = max(start, note_start), min(end, note_end)
+            if a < b:
+                mix[a - start:b - start] += render(a - note_start, b - a)
+            if note_end > end:
+                still_active.append(entry)
+        self.active = still_active
+        self.wav.writeframesraw(to_pcm16(master(mix)).tobytes())
+        self.frame = end
+
+    def render(self, until_frame):
+        """Write every block that ends at or before until_frame."""
+        with timer("wav_render"):
+            while self.frame + self.block <= until_frame:
+                self._render_block(self.block)
+
+    def render_time(self, seconds):
+        self.render(int(seconds * self.sample_rate))
+
+    def close(self):
+        """Render what is left, trimmed to the last sounding frame; returns seconds."""
+        sr = self.sample_rate
+        last = max([entry[1] for entry in self.active] + [self.frame] +
+                   [start + (drum_frames(pitch, sr) if is_drum else tone_frames(held, VOICES[role], sr))
+                    for start, _, is_drum, pitch, held, _, role in self.pending])
+        with timer("wav_render"):
+            while self.frame < last:
+                self._render_block(min(self.block, last - self.frame))
+        self.wav.close()
+        count_wav(self.frame, sr)
+        return self.frame / self.sample_rate
+
+
+def count_wav(frames, sample_rate):
+    count("files_written")
+    count("bytes_written", 44 + 2 * frames)   # canonical PCM header + int16 mono
+    count("audio_seconds", frames / sample_rate)
+
+
+def render_wav(track_data, filename, sample_rate=SAMPLE_RATE, block=BLOCK_FRAMES, cache=TONE_CACHE):
+    """Render track_data to a mono 16-bit WAV block by block; returns the audio length in seconds.
+
+    `filename` may also be a seekable binary file object (e.g. io.BytesIO).
+    """
+    writer = WavStreamWriter(filename, sample_rate, block, cache)
+    for name, notes, is_drum in track_data:
+        writer.add(notes, is_drum, name)
+    return writer.close()
+
+
+def balance_tracks(track_data, groups):
+    """Split tracks into `groups` lists of similar note counts (largest first)."""
+    buckets = [[] for _ in range(groups)]
+    loads = [0] * groups
+    for track in sorted(track_data, key=lambda t: -len(t[1])):
+        i = loads.index(min(loads))
+        buckets[i].append(track)
+        loads[i] += len(track[1])
+    return [b for b in buckets if b]
+
+
+def render_into_shared(job):
+    """Worker: add a group of tracks into a named shared float32 buffer."""
+    shm_name, frames, sample_rate, tracks = job
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(frames, dtype=np.float32, buffer=shm.buf)
+        for name, notes, is_drum in tracks:
+            render_track(notes, is_drum, name, sample_rate, out=out)
+        del out
+    finally:
+        shm.close()
+    return len(tracks)
+
+
+def render_wav_parallel(track_data, filename, sample_rate=SAMPLE_RATE, jobs=None):
+    """Render tracks on `jobs` processes (default: all cores) and mix via shared memory.
+
+    Each worker slot owns one song-length buffer, so memory is jobs x song
+    length rather than tracks x song length. Mixing order depends on the
+    grouping, so samples may differ from render_wav by one LSB.
+    Returns the audio length in seconds.
+    """
+    with timer("wav_render"):
+        seconds = _render_wav_parallel(track_data, filename, sample_rate, jobs or os.cpu_count() or 1)
+    count_wav(int(seconds * sample_rate), sample_rate)
+    return seconds
+
+
+def _render_wav_parallel(track_data, filename, sample_rate, jobs):
+    groups = balance_tracks(track_data, jobs)
+    frames = song_frames(track_data, sample_rate)
+    nbytes = max(frames, 1) * np.dtype(np.float32).itemsize
+    buffers = [shared_memory.SharedMemory(create=True, size=nbytes) for _ in groups]
+    try:
+        for shm in buffers:
+            np.ndarray(frames, dtype=np.float32, buffer=shm.buf).fill(0.0)
+        todo = [(shm.name, frames, sample_rate, group) for shm, group in zip(buffers, groups)]
+        if len(todo) > 1:
+            with ProcessPoolExecutor(max_workers=len(todo)) as pool:
+                list(pool.map(render_into_shared, todo))
+        else:
+            list(map(render_into_shared, todo))
+
+        mix = np.zeros(frames, dtype=np.float32)
+        for shm in buffers:
+            mix += np.ndarray(frames, dtype=np.float32, buffer=shm.buf)
+        write_wav(master(mix), filename, sample_rate)
+    finally:
+        for shm in buffers:
+            shm.close()
+            shm.unlink()
+    return frames / sample_rate
+
+
+# ============================
+# BENCHMARK: python -m musictheory.synth
+# ============================
+def benchmark(bars=180, genre="pop", seed=0, sample_rate=SAMPLE_RATE):
+    """Render a generated song (one bar lasts a second); returns (audio s, render s)."""
+    import os
+    import random
+    import tempfile
+    import time
+    from .arranger import iter_song_sections
+
+    tracks = [(f"{section}_{role}", notes, is_drum)
+              for section, _, roles in iter_song_sections(60, genre, bars, random.Random(seed))
+              for role, notes, is_drum in roles]
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        audio = render_wav(tracks, os.path.join(tmp, "bench.wav"), sample_rate)
+        return audio, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render a generated song and report the real-time factor.")
+    parser.add_argument("--bars", type=int, default=180, help="Song length in bars (default: 3 minutes)")
+    parser.add_argument("--genre", default="pop")
+    args = parser.parse_args()
+
+    audio, seconds = benchmark(args.bars, args.genre)
+    print(f"rendered {audio:.1f}s of audio in {seconds:.2f}s → {audio / seconds:.1f}x real time")
+    stats = TONE_CACHE.stats()
+    print(f"tone cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.1%}), "
+          f"{stats['entries']} entries, {stats['bytes'] / 2**20:.1f} MB")
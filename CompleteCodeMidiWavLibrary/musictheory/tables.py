@@ -0,0 +1,82 @@
+# musictheory/tables.py
+# ============================
+# Precomputed pitch tables
+# ============================
+# Chord inversions, chord voicings and scale pitches are derived once from the
+# theory dictionaries, so generator inner loops only index: every (root,
+# chord, inversion) and (root, scale) is a dict lookup returning a shared
+# tuple (cheaper than building a list per call).
+
+import json
+
+from .config import CHORD_FORMULAS, SCALE_INTERVALS, MODES
+
+MIDI_RANGE = range(128)
+
+
+def chord_inversions(formula):
+    return [formula[i:] + [n+12 for n in formula[:i]] for i in range(len(formula))]
+
+
+def check_root(root_midi):
+    if root_midi not in MIDI_RANGE:
+        raise ValueError(f"Root outside the MIDI range 0-127: {root_midi!r}")
+
+
+class TheoryTables:
+    """Immutable pitch lookups built from a chord-formula dict and a scale dict,
+    for every MIDI root."""
+
+    def __init__(self, chord_formulas, scales):
+        self.chord_names = tuple(chord_formulas)
+        self.scale_names = tuple(scales)
+
+        self._inversions = {name: tuple(tuple(inv) for inv in chord_inversions(list(f)))
+                            for name, f in chord_formulas.items()}
+        self._intervals = {name: tuple(ints) for name, ints in scales.items()}
+
+        self._chords = {(root, name, inv_i): tuple(root + n for n in inv)
+                        for name, invs in self._inversions.items()
+                        for inv_i, inv in enumerate(invs)
+                        for root in MIDI_RANGE}
+        self._scales = {(root, name): tuple(root + i for i in ints)
+                        for name, ints in self._intervals.items()
+                        for root in MIDI_RANGE}
+
+    def inversions(self, chord_name):
+        """All inversions of a chord as interval tuples."""
+        return self._inversions[chord_name]
+
+    def chord(self, root_midi, chord_name, inversion=0):
+        try:
+            return self._chords[root_midi, chord_name, inversion]
+        except KeyError:
+            check_root(root_midi)
+            raise
+
+    def scale(self, root_midi, scale_name):
+        try:
+            return self._scales[root_midi, scale_name]
+        except KeyError:
+            check_root(root_midi)
+            raise
+
+
+_SHARED = {}
+
+
+def shared_tables(chord_formulas, scales):
+    """TheoryTables for these dicts, built once per process and reused by every
+    caller passing equal dicts (library profiles share most of their theory)."""
+    key = json.dumps([list(chord_formulas.items()), list(scales.items())])
+    tables = _SHARED.get(key)
+    if tables is None:
+        tables = _SHARED[key] = TheoryTables(chord_formulas, scales)
+    return tables
+
+
+# Package tables: every chord in CHORD_FORMULAS, every scale and mode
+TABLES = TheoryTables(CHORD_FORMULAS, {**SCALE_INTERVALS, **MODES})
+
+chord_pitches = TABLES.chord
+scale_pitches = TABLES.scale
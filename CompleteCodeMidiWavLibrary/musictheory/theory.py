@@ -1,14 +1,102 @@
-from .config import CHORD_FORMULAS, ROMAN_TO_CHORD
+import re
+from functools import lru_cache
+import numpy as np
+from .config import CHORD_FORMULAS, MODES, ROMAN_TO_CHORD, SCALE_INTERVALS
+from .tables import chord_inversions, chord_pitches
 
-def chord_inversions(formula):
-    return [formula[i:] + [n+12 for n in formula[:i]] for i in range(len(formula))]
+# Compiled progressions are small; this bounds the caches to a few MB even if
+# callers feed many distinct (sequence, root, mode) combinations.
+PROGRESSION_CACHE_SIZE = 4096
 
-def roman_to_midi_progression(roman_seq, root_midi, key_mode="major"):
+MAJOR_DEGREES = SCALE_INTERVALS["major"]
+NUMERALS = {"I": 0, "II": 1, "III": 2, "IV": 3, "V": 4, "VI": 5, "VII": 6}
+
+# accidentals, numeral, quality mark, extension: "bVII", "vii°7", "iiø", "V9", "IVmaj7"
+NUMERAL_RE = re.compile(r"^(?P<acc>[b#♭♯]*)(?P<num>[ivIV]+)(?P<qual>°|o|ø|\+|dim|aug)?"
+                        r"(?P<ext>maj7|maj9|7|9|11|13|6)?$")
+
+# (upper/lower case, quality mark, extension) -> CHORD_FORMULAS key
+CHORD_QUALITIES = {
+    ("upper", None, None): "major", ("lower", None, None): "minor",
+    ("upper", None, "7"): "dominant7", ("lower", None, "7"): "minor7",
+    ("upper", None, "maj7"): "major7", ("upper", None, "maj9"): "major9",
+    ("upper", None, "9"): "9", ("lower", None, "9"): "minor9",
+    ("upper", None, "11"): "11", ("upper", None, "13"): "13",
+    ("upper", None, "6"): "major6", ("lower", None, "6"): "minor6",
+    ("lower", "dim", None): "diminished", ("lower", "dim", "7"): "diminished7",
+    ("lower", "half", None): "half_diminished7", ("lower", "half", "7"): "half_diminished7",
+    ("upper", "aug", None): "augmented",
+}
+QUALITY_MARKS = {"°": "dim", "o": "dim", "dim": "dim", "ø": "half", "+": "aug", "aug": "aug"}
+# Minor keys borrow the raised 7th for the diminished vii chord (harmonic minor)
+LEADING_TONE_MODES = ("minor", "aeolian")
+LEADING_TONE = 11
+
+
+def key_degrees(key_mode):
+    """Semitone offsets of the seven scale degrees of a major/minor key or mode."""
+    degrees = SCALE_INTERVALS.get(key_mode) or MODES.get(key_mode)
+    if degrees is None or len(degrees) != 7:
+        raise ValueError(f"Unsupported key mode: {key_mode!r}")
+    return degrees
+
+
+@lru_cache(maxsize=PROGRESSION_CACHE_SIZE)
+def parse_numeral(rn, key_mode="major"):
+    """Roman numeral -> (semitones above the key root, CHORD_FORMULAS key).
+
+    Plain numerals are diatonic to key_mode ("III" is 3 semitones in minor, 4
+    in major); accidentals are relative to the major scale ("bVII" is 10 in
+    either). In a minor key vii°/vii°7 sit on the leading tone (11), as in
+    harmonic minor. Case picks major/minor; °, ø, + and 7/maj7/9/11/13/6
+    refine it. 11 and 13 chords exist only in major (dominant) quality, so
+    "ii11" or "vi13" raise ValueError. In a major key an explicit
+    ROMAN_TO_CHORD entry wins.
+    """
+    if key_mode == "major" and rn in ROMAN_TO_CHORD:
+        return ROMAN_TO_CHORD[rn]
+    m = NUMERAL_RE.match(rn)
+    if not m or m["num"].upper() not in NUMERALS or not (m["num"].isupper() or m["num"].islower()):
+        raise ValueError(f"Unknown roman numeral: {rn!r}")
+    index = NUMERALS[m["num"].upper()]
+    accidental = sum(-1 if a in "b♭" else 1 for a in m["acc"])
+    case = "upper" if m["num"].isupper() else "lower"
+    mark = QUALITY_MARKS.get(m["qual"])
+    if accidental:
+        degree = MAJOR_DEGREES[index] + accidental
+    elif index == 6 and mark == "dim" and key_mode in LEADING_TONE_MODES:
+        degree = LEADING_TONE
+    else:
+        degree = key_degrees(key_mode)[index]
+    quality = CHORD_QUALITIES.get((case, mark, m["ext"]))
+    if quality is None or quality not in CHORD_FORMULAS:
+        raise ValueError(f"Unsupported chord quality in roman numeral: {rn!r}")
+    return degree % 12, quality
+
+
+def compile_progression(roman_seq, key_mode="major"):
+    """Tuple of read-only int16 arrays, one chord each, in semitones above the
+    key root; transpose with `root_midi + chord`."""
+    return _compile_progression(tuple(roman_seq), key_mode)
+
+
+@lru_cache(maxsize=PROGRESSION_CACHE_SIZE)
+def _compile_progression(roman_seq, key_mode):
     out = []
     for rn in roman_seq:
-        if rn not in ROMAN_TO_CHORD:
-            continue
-        degree, chord_type = ROMAN_TO_CHORD[rn]
-        chord = [root_midi + degree + n for n in CHORD_FORMULAS[chord_type]]
+        degree, chord_type = parse_numeral(rn, key_mode)
+        chord = np.array(CHORD_FORMULAS[chord_type], dtype=np.int16) + degree
+        chord.flags.writeable = False
         out.append(chord)
-    return out
+    return tuple(out)
+
+
+@lru_cache(maxsize=PROGRESSION_CACHE_SIZE)
+def progression_pitches(roman_seq, root_midi, key_mode="major"):
+    """Compiled progression as tuples of MIDI pitches for one key."""
+    return tuple(chord_pitches(root_midi + degree, chord_type)
+                 for degree, chord_type in (parse_numeral(rn, key_mode) for rn in roman_seq))
+
+
+def roman_to_midi_progression(roman_seq, root_midi, key_mode="major"):
+    return [list(chord) for chord in progression_pitches(tuple(roman_seq), root_midi, key_mode)]
@@ -0,0 +1,115 @@
+# musictheory/transpose.py
+# ============================
+# Transpose-by-template: re-key an encoded MIDI file without rebuilding it
+# ============================
+# Library files for the 12 roots of a scale, chord or progression differ only
+# in their melodic pitch bytes and the root name in track names (as long as
+# they share a humanization seed). SMFTemplate parses one encoded file once,
+# remembering where every melodic note's pitch byte sits and where each track
+# name lives; render() then copies the bytes with pitches shifted in place and
+# names substituted, recomputing only the track chunk lengths. Drum-channel
+# notes are left alone. Works on files from either backend (pretty_midi/smf).
+
+import os
+import struct
+
+from .smf import DRUM_CHANNEL, varlen
+
+TRACK_NAME = 0x03
+NOTE_KINDS = (0x80, 0x90, 0xA0)     # note off, note on, poly aftertouch: data byte 1 is the pitch
+
+
+def read_varlen(data, pos):
+    value = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        value = (value << 7) | (b & 0x7F)
+        if not b & 0x80:
+            return value, pos
+
+
+def parse_track(chunk):
+    """MTrk payload -> (prefix, name, body, pitch offsets into body).
+
+    The first track-name meta event is cut out so it can be re-encoded with a
+    different length; prefix/body are the bytes before and after it.
+    """
+    offsets = []
+    name_span = None
+    status = 0
+    pos = 0
+    while pos < len(chunk):
+        _, pos = read_varlen(chunk, pos)
+        b = chunk[pos]
+        if b == 0xFF:
+            length, start = read_varlen(chunk, pos + 2)
+            if chunk[pos + 1] == TRACK_NAME and name_span is None:
+                name_span = (pos, start + length, chunk[start:start + length].decode("latin1"))
+            pos = start + length
+            continue
+        if b in (0xF0, 0xF7):
+            length, start = read_varlen(chunk, pos + 1)
+            pos = start + length
+            continue
+        if b & 0x80:
+            status = b
+            pos += 1
+        kind = status & 0xF0
+        if kind in NOTE_KINDS and (status & 0x0F) != DRUM_CHANNEL:
+            offsets.append(pos)
+        pos += 1 if kind in (0xC0, 0xD0) else 2
+
+    if name_span is None:
+        return b"", None, bytes(chunk), offsets
+    start, end, name = name_span
+    return bytes(chunk[:start]), name, bytes(chunk[end:]), [o - end for o in offsets]
+
+
+class SMFTemplate:
+    def __init__(self, data):
+        if data[:4] != b"MThd":
+            raise ValueError("not a Standard MIDI File")
+        header_len = struct.unpack(">I", data[4:8])[0]
+        self.header = bytes(data[:8 + header_len])
+        self.tracks = []
+        pos = len(self.header)
+        while pos < len(data):
+            chunk_id, length = data[pos:pos + 4], struct.unpack(">I", data[pos + 4:pos + 8])[0]
+            if chunk_id == b"MTrk":
+                self.tracks.append(parse_track(data[pos + 8:pos + 8 + length]))
+            pos += 8 + length
+        self.pitches = sum(len(t[3]) for t in self.tracks)
+
+    def render(self, shift=0, rename=None):
+        """Bytes with melodic pitches moved by `shift` semitones and names mapped by `rename`."""
+        out = [self.header]
+        for prefix, name, body, offsets in self.tracks:
+            if shift and offsets:
+                body = bytearray(body)
+                for o in offsets:
+                    pitch = body[o] + shift
+                    if not 0 <= pitch < 128:
+                        raise ValueError(f"transposed pitch out of MIDI range: {pitch}")
+                    body[o] = pitch
+            if name is not None:
+                raw = (rename(name) if rename else name).encode("latin1")
+                chunk = prefix + b"\xff\x03" + varlen(len(raw)) + raw + body
+            else:
+                chunk = prefix + body
+            out += (b"MTrk", struct.pack(">I", len(chunk)), chunk)
+        return b"".join(out)
+
+
+def rekey(text, old, new):
+    """Swap the root name at the start of a name: 'C_major_scale' -> 'D_major_scale'."""
+    if text == old:
+        return new
+    if text.startswith(old + "_"):
+        return new + text[len(old):]
+    return text
+
+
+def rekey_path(path, old, new):
+    """rekey() applied to every component of a library path."""
+    return os.sep.join(rekey(part, old, new) for part in path.split(os.sep))
@@ -1,35 +1,148 @@
-import os, random
+import io
+import os
+import numpy as np
 import pretty_midi
+from .config import GENRE_EXPRESSIONS, HUMANIZATION
+from .instrument import count, timer
+from .notes import note_array
+from .sink import FileSink
+from .smf import encode_smf, iter_note_rows
 
 SWING_AMOUNT = 0.58
 TIMING_JITTER = 0.01
 VELOCITY_JITTER = 6
 
 def ensure_dir(p):
-    os.makedirs(p, exist_ok=True)
+    if p:
+        os.makedirs(p, exist_ok=True)
 
-def humanize_notes(notes, swing=True):
-    out = []
-    for pitch, start, end, vel in notes:
-        if swing:
+def humanization_profile(genre=None):
+    """Swing shift, timing jitter and velocity jitter for a genre.
+
+    Without a genre (or for one missing from GENRE_EXPRESSIONS) the module
+    defaults apply: a fixed off-beat swing and +/-VELOCITY_JITTER velocity.
+    Genre profiles take their jitter from GENRE_EXPRESSIONS[genre]["humanization"]
+    (velocity jitter as a fraction of each note's velocity) and swing by
+    HUMANIZATION["swing_strength"] when the genre swings.
+    """
+    expr = GENRE_EXPRESSIONS.get(genre)
+    if expr is None:
+        return {"swing": (SWING_AMOUNT - 0.5) * 0.25, "timing_jitter": TIMING_JITTER,
+                "velocity_jitter": VELOCITY_JITTER, "velocity_scale": 0.0}
+    human = expr.get("humanization", {})
+    return {
+        "swing": HUMANIZATION["swing_strength"] * 0.25 if expr.get("swing") else 0.0,
+        "timing_jitter": human.get("timing_jitter", HUMANIZATION["timing_jitter"]),
+        "velocity_jitter": 0,
+        "velocity_scale": human.get("velocity_jitter", HUMANIZATION["velocity_jitter"]),
+    }
+
+def humanize_notes(notes, swing=True, genre=None, rng=None, seed=None):
+    """Swing, timing and velocity jitter for a whole track in one NumPy pass.
+
+    Returns a new note array. Pass a numpy.random.Generator (or a seed) to make
+    the result reproducible; tracks of one song should share a generator.
+    """
+    with timer("humanize"):
+        notes = note_array(notes).copy()
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        profile = humanization_profile(genre)
+        start, end = notes["start"], notes["end"]
+        if swing and profile["swing"]:
             eighth_pos = (start*2) % 2
-            if 0.9 < eighth_pos < 1.1:
-                shift = (SWING_AMOUNT - 0.5) * 0.25
-                start += shift; end += shift
-        start = max(0.0, start + random.uniform(-TIMING_JITTER, TIMING_JITTER))
-        end   = max(start+0.01, end + random.uniform(-TIMING_JITTER, TIMING_JITTER))
-        vel   = max(1, min(127, vel + random.randint(-VELOCITY_JITTER, VELOCITY_JITTER)))
-        out.append((pitch, start, end, vel))
-    return out
-
-def create_named_midi(track_data, filename):
-    """track_data = [(name, [(pitch,start,end,vel), ...], is_drum_bool), ...]"""
-    ensure_dir(os.path.dirname(filename))
-    pm = pretty_midi.PrettyMIDI()
-    for name, notes, is_drum in track_data:
-        program = 0  # TODO: map instruments by genre
-        inst = pretty_midi.Instrument(program=program, name=name, is_drum=is_drum)
-        for pitch, start, end, vel in humanize_notes(notes):
-            inst.notes.append(pretty_midi.Note(velocity=vel, pitch=pitch, start=start, end=end))
-        pm.instruments.append(inst)
-    pm.write(filename)
+            shift = np.where((eighth_pos > 0.9) & (eighth_pos < 1.1), profile["swing"], 0.0)
+            start += shift; end += shift
+        n, jitter = len(notes), profile["timing_jitter"]
+        np.maximum(start + rng.uniform(-jitter, jitter, n), 0.0, out=start)
+        np.maximum(end + rng.uniform(-jitter, jitter, n), start+0.01, out=end)
+        vel = notes["velocity"].astype(np.float64)
+        if profile["velocity_scale"]:
+            vel *= 1 + rng.uniform(-profile["velocity_scale"], profile["velocity_scale"], n)
+        if profile["velocity_jitter"]:
+            vel += rng.integers(-profile["velocity_jitter"], profile["velocity_jitter"], n, endpoint=True)
+        notes["velocity"] = np.clip(np.rint(vel), 1, 127)
+    count("notes_humanized", len(notes))
+    return notes
+
+MIDI_BACKENDS = ("pretty_midi", "smf")
+
+# Encoder used when a call doesn't name one: "smf" writes the same bytes as
+# "pretty_midi" without building the PrettyMIDI object graph
+MIDI_BACKEND = "smf"
+
+def resolve_backend(backend=None):
+    """`backend`, or the current MIDI_BACKEND if None; rejects unknown names."""
+    backend = backend or MIDI_BACKEND
+    if backend not in MIDI_BACKENDS:
+        raise ValueError(f"Unknown MIDI backend: {backend!r} (choose from {MIDI_BACKENDS})")
+    return backend
+
+def set_midi_backend(backend):
+    """Make `backend` the default for every encoder call that doesn't name one."""
+    global MIDI_BACKEND
+    MIDI_BACKEND = resolve_backend(backend)
+
+def create_named_midi(track_data, filename, backend=None, genre=None, rng=None, seed=None):
+    """track_data = [(name, [(pitch,start,end,vel), ...], is_drum_bool), ...]
+
+    backend: "pretty_midi" builds a PrettyMIDI object graph; "smf" encodes the
+    track chunks directly with musictheory.smf (same bytes, far less overhead);
+    None uses MIDI_BACKEND.
+    genre/rng/seed select the humanization profile and make it reproducible.
+    Returns the humanized track data that was written.
+    """
+    data, track_data = encode_named_midi(track_data, backend, genre, rng, seed)
+    write_file(filename, data, sum(len(notes) for _, notes, _ in track_data))
+    return track_data
+
+def encode_named_midi(track_data, backend=None, genre=None, rng=None, seed=None):
+    """Humanize and encode in memory; returns (MIDI bytes, humanized track data)."""
+    backend = resolve_backend(backend)
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    track_data = [(name, humanize_notes(notes, genre=genre, rng=rng), is_drum)
+                  for name, notes, is_drum in track_data]
+    return encode_tracks(track_data, backend), track_data
+
+def encode_tracks(track_data, backend=None):
+    """Encode (name, notes, is_drum[, program]) tracks as they are, without
+    humanizing; notes may be note arrays or (pitch, start, end, vel) lists."""
+    backend = resolve_backend(backend)
+    with timer("midi_encode"):
+        if backend == "smf":
+            return encode_smf(track_data)
+        pm = pretty_midi.PrettyMIDI()
+        for track in track_data:
+            name, notes, is_drum = track[:3]
+            inst = pretty_midi.Instrument(program=track[3] if len(track) > 3 else 0,
+                                          name=name or "", is_drum=is_drum)
+            inst.notes = [pretty_midi.Note(velocity=int(vel), pitch=int(pitch), start=start, end=end)
+                          for pitch, start, end, vel in iter_note_rows(notes)]
+            pm.instruments.append(inst)
+        buf = io.BytesIO()
+        pm.write(buf)
+        return buf.getvalue()
+
+# Where write_file sends encoded files; see musictheory.sink
+SINK = FileSink()
+
+def set_sink(sink):
+    """Route write_file through `sink` (e.g. a ThreadedFileSink); returns the previous sink."""
+    global SINK
+    previous, SINK = SINK, sink
+    return previous
+
+def write_file(filename, data, notes=0, replace=False):
+    """Hand an encoded file to the current sink, counting it for instrumentation.
+
+    replace=True removes whatever is at `filename` first, so a link left by a
+    deduplicated build is never written through.
+    """
+    if replace and os.path.lexists(filename):
+        os.remove(filename)
+    with timer("file_write"):
+        SINK.write(filename, data)
+    count("files_written")
+    count("bytes_written", len(data))
+    count("notes_written", notes)